@@ -5,8 +5,8 @@ Handles all communication with the BlueBubbles server
 
 import aiohttp
 import asyncio
-from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin, urlparse
+from typing import AsyncIterator, Dict, List, Optional, Any
+from urllib.parse import urlparse, quote
 import json
 
 class BlueBubblesClient:
@@ -17,22 +17,40 @@ class BlueBubblesClient:
         self.password = password
         self.api_method = api_method  # 'applescript' or 'private'
         self.session = None
+        
+        # The server URL and password are fixed for the client's lifetime,
+        # so build the reusable pieces of every request URL once. The base
+        # keeps any path prefix (e.g. a server behind a reverse proxy at
+        # https://host/bluebubbles).
+        self._base_url = self.server_url
+        self._auth_query = f"password={quote(password, safe='')}"
+        self._json_headers = {'Content-Type': 'application/json'}
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
-        return self
+        return await self.open()
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        await self.close()
+    
+    async def open(self) -> 'BlueBubblesClient':
+        """Open the HTTP session; connections are pooled and kept alive between requests."""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=20, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self
+    
+    async def close(self):
+        """Close the HTTP session."""
         if self.session:
             await self.session.close()
+            self.session = None
     
     def _build_url(self, endpoint: str) -> str:
         """Build a complete URL with the password parameter."""
-        url = urljoin(self.server_url, endpoint)
-        separator = '&' if '?' in url else '?'
-        return f"{url}{separator}password={self.password}"
+        separator = '&' if '?' in endpoint else '?'
+        return f"{self._base_url}{endpoint}{separator}{self._auth_query}"
     
     def _add_api_method_to_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Add API method to request payload if using private API."""
@@ -103,10 +121,43 @@ class BlueBubblesClient:
             'POST', 
             '/api/v1/chat/query',
             json=payload,
-            headers={'Content-Type': 'application/json'}
+            headers=self._json_headers
+        )
+        return response.get('data', [])
+    
+    async def get_handles(self, limit: int = 1000, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get handles (contact addresses) known to the server."""
+        payload = {
+            'limit': limit,
+            'offset': offset
+        }
+        
+        response = await self._make_request(
+            'POST',
+            '/api/v1/handle/query',
+            json=payload,
+            headers=self._json_headers
         )
         return response.get('data', [])
     
+    async def iter_handles(self, page_size: int = 250, max_pages: int = 20) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of handles until the server has no more.
+        
+        Stops after max_pages, or if a page repeats the previous one (a
+        server that ignores offset would otherwise be paged forever).
+        """
+        previous_addresses = None
+        for page_number in range(max_pages):
+            page = await self.get_handles(limit=page_size, offset=page_number * page_size)
+            addresses = [handle.get('address') for handle in page]
+            if not page or addresses == previous_addresses:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            previous_addresses = addresses
+    
     async def get_chat_messages(self, chat_guid: str, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """Get messages for a specific chat."""
         endpoint = f'/api/v1/chat/{chat_guid}/message'
@@ -128,7 +179,7 @@ class BlueBubblesClient:
             'POST',
             '/api/v1/message/text',
             json=payload,
-            headers={'Content-Type': 'application/json'}
+            headers=self._json_headers
         )
         return response.get('data', {})
     
@@ -148,7 +199,7 @@ class BlueBubblesClient:
                 'POST',
                 '/api/v1/chat/new',
                 json=payload,
-                headers={'Content-Type': 'application/json'}
+                headers=self._json_headers
             )
             return response.get('data', {})
         except BlueBubblesAPIError as e:
@@ -215,7 +266,7 @@ class BlueBubblesClient:
             'POST',
             '/api/v1/message/react',
             json=payload,
-            headers={'Content-Type': 'application/json'}
+            headers=self._json_headers
         )
         # print(f"🌐 Raw response: {response}")
         return response.get('data', {})
@@ -241,7 +292,7 @@ class BlueBubblesClient:
             'POST',
             '/api/v1/message/react',
             json=payload,
-            headers={'Content-Type': 'application/json'}
+            headers=self._json_headers
         )
         # print(f"🌐 Raw response: {response}")
         return response.get('data', {})
@@ -259,7 +310,7 @@ class BlueBubblesClient:
                 'POST',
                 '/api/v1/chat/typing',
                 json=payload,
-                headers={'Content-Type': 'application/json'}
+                headers=self._json_headers
             )
             return True
         except BlueBubblesAPIError:
@@ -276,7 +327,7 @@ class BlueBubblesClient:
             'POST',
             '/api/v1/message/unsend',
             json=payload,
-            headers={'Content-Type': 'application/json'}
+            headers=self._json_headers
         )
         return response.get('data', {})
     
@@ -292,7 +343,7 @@ class BlueBubblesClient:
             'POST',
             '/api/v1/message/edit',
             json=payload,
-            headers={'Content-Type': 'application/json'}
+            headers=self._json_headers
         )
         return response.get('data', {})
     
@@ -300,8 +351,7 @@ class BlueBubblesClient:
         """Get contact avatar/profile picture."""
         response = await self._make_request(
             'GET',
-            f'/api/v1/contact/{address}',
-            params={'password': self.password}
+            f'/api/v1/contact/{address}'
         )
         
         # The contact endpoint returns contact info including base64 avatar
@@ -318,8 +368,7 @@ class BlueBubblesClient:
         try:
             # This endpoint returns the raw image data
             async with self.session.get(
-                f"{self.base_url}/api/v1/chat/{chat_guid}/icon",
-                params={'password': self.password}
+                self._build_url(f'/api/v1/chat/{chat_guid}/icon')
             ) as response:
                 if response.status == 200:
                     return await response.read()
@@ -332,8 +381,7 @@ class BlueBubblesClient:
         try:
             await self._make_request(
                 'POST',
-                f'/api/v1/chat/{chat_guid}/read',
-                params={'password': self.password}
+                f'/api/v1/chat/{chat_guid}/read'
             )
             return True
         except BlueBubblesAPIError:
@@ -344,8 +392,7 @@ class BlueBubblesClient:
         try:
             # This endpoint returns the raw attachment data
             async with self.session.get(
-                f"{self.server_url}/api/v1/attachment/{attachment_guid}/download",
-                params={'password': self.password}
+                self._build_url(f'/api/v1/attachment/{attachment_guid}/download')
             ) as response:
                 if response.status == 200:
                     return await response.read()
@@ -358,8 +405,7 @@ class BlueBubblesClient:
         try:
             response = await self._make_request(
                 'GET',
-                f'/api/v1/attachment/{attachment_guid}',
-                params={'password': self.password}
+                f'/api/v1/attachment/{attachment_guid}'
             )
             return response.get('data', {})
         except BlueBubblesAPIError:
@@ -7,8 +7,10 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, Gio, GLib
-from pathlib import Path
+from gi.repository import Gtk, Adw, Gio, GLib, Gdk
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .config.manager import ConfigManager
@@ -18,6 +20,12 @@ from .ui.preferences_dialog import PreferencesDialog
 from .db.manager import DatabaseManager
 from .services.chat_service import ChatService
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop not available, the stock asyncio loop is used
+    uvloop = None
+
 class BlueBubblesApplication(Adw.Application):
     """Main application class that manages the entire application lifecycle."""
     
@@ -29,36 +37,76 @@ class BlueBubblesApplication(Adw.Application):
         
         self.config_manager = ConfigManager()
         
+        # Single app-wide asyncio loop for all background network work
+        # (uvloop's faster libuv-based loop when it is installed)
+        self.app_loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        # Bounded pool for blocking work the loop hands off, e.g. DNS lookups
+        self.app_loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=2, thread_name_prefix="bb-io")
+        )
+        # Start tasks eagerly so quick calls finish without a scheduler round-trip
+        # (asyncio.eager_task_factory is only available on Python 3.12+)
+        if hasattr(asyncio, 'eager_task_factory'):
+            self.app_loop.set_task_factory(asyncio.eager_task_factory)
+        self._loop_thread = threading.Thread(
+            target=self.app_loop.run_forever, name="bb-asyncio", daemon=True
+        )
+        self._loop_thread.start()
+        
         # Initialize database and services
         self.db_manager = DatabaseManager()
-        self.chat_service = ChatService(self.db_manager, self.config_manager)
+        self.chat_service = ChatService(self.db_manager, self.config_manager, self.app_loop)
         
         self.main_window = None
         self.login_window = None
+        self.css_provider = None
         
         self.connect('activate', self.on_activate)
         self.connect('startup', self.on_startup)
+        self.connect('shutdown', self.on_shutdown)
     
     def on_startup(self, app):
         """Called when the application starts up."""
         self.setup_actions()
         self.apply_theme_preference()
+        self.load_styles()
+    
+    def on_shutdown(self, app):
+        """Called when the application shuts down."""
+        self.chat_service.stop_message_checking()
+        
+        # Close the pooled HTTP sessions before the loop goes away
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self.chat_service.close_clients(), self.app_loop
+            ).result(timeout=2.0)
+        except Exception as e:
+            pass  # Sessions are dropped with the loop anyway
+        
+        self.app_loop.call_soon_threadsafe(self.app_loop.stop)
+        self._loop_thread.join(timeout=2.0)
+        
+        self.config_manager.flush()
     
     def load_styles(self):
-        """Load custom CSS styles."""
+        """Load custom CSS styles once for every window on the default display."""
+        if self.css_provider is not None:
+            return
+        
         try:
             css_provider = Gtk.CssProvider()
             css_path = Path(__file__).parent / 'ui' / 'styles.css'
             css_provider.load_from_path(str(css_path))
             
             # Apply to default display
-            if self.main_window:
-                display = self.main_window.get_display()
+            display = Gdk.Display.get_default()
+            if display:
                 Gtk.StyleContext.add_provider_for_display(
                     display,
                     css_provider,
                     Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
                 )
+                self.css_provider = css_provider
         except Exception as e:
             pass  # Silently handle CSS loading errors
         
@@ -95,7 +143,6 @@ class BlueBubblesApplication(Adw.Application):
         """Show the main application window."""
         if self.main_window is None:
             self.main_window = MainWindow(application=self)
-            self.load_styles()  # Load styles after window is created
         self.main_window.present()
     
     def get_chat_service(self) -> ChatService:
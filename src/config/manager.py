@@ -5,6 +5,7 @@ Handles loading and saving configuration from/to bb.toml in user's config direct
 
 import os
 import toml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional, Any
 
@@ -15,6 +16,11 @@ class ConfigManager:
         self.config_dir = self._get_config_dir()
         self.config_file = self.config_dir / "bb.toml"
         self._config_data = {}
+        self._change_callbacks = []
+        # Config files are written on one background thread, in order,
+        # so saving never blocks the GTK main loop
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bb-config")
+        self._last_save = None
         self._load_config()
     
     def _get_config_dir(self) -> Path:
@@ -39,16 +45,26 @@ class ConfigManager:
             self._config_data = {}
     
     def _save_config(self):
-        """Save current configuration to bb.toml file."""
-        # Ensure config directory exists
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        
+        """Save current configuration to bb.toml file in the background."""
+        # Serialize now so later changes can't race the background write
+        text = toml.dumps(self._config_data)
+        self._last_save = self._save_executor.submit(self._write_config, text)
+    
+    def _write_config(self, text: str):
+        """Write serialized configuration to bb.toml (runs on the save thread)."""
         try:
+            # Ensure config directory exists
+            self.config_dir.mkdir(parents=True, exist_ok=True)
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                toml.dump(self._config_data, f)
+                f.write(text)
         except IOError as e:
             pass  # Silently handle config save errors
     
+    def flush(self):
+        """Wait for pending configuration writes to finish."""
+        if self._last_save is not None:
+            self._last_save.result()
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
         keys = key.split('.')
@@ -76,6 +92,24 @@ class ConfigManager:
         # Set the final value
         config[keys[-1]] = value
         self._save_config()
+        self._notify_change(key)
+    
+    def add_change_callback(self, callback):
+        """Add a callback to be called with the key whenever a value changes."""
+        self._change_callbacks.append(callback)
+    
+    def remove_change_callback(self, callback):
+        """Remove a change callback."""
+        if callback in self._change_callbacks:
+            self._change_callbacks.remove(callback)
+    
+    def _notify_change(self, key: str):
+        """Notify change callbacks that a key was updated."""
+        for callback in list(self._change_callbacks):
+            try:
+                callback(key)
+            except Exception as e:
+                pass  # Silently handle callback errors
     
     def has_valid_config(self) -> bool:
         """Check if we have a valid configuration for connecting to BlueBubbles."""
@@ -101,6 +135,7 @@ class ConfigManager:
         if 'server' in self._config_data:
             del self._config_data['server']
             self._save_config()
+            self._notify_change('server')
     
     def get_appearance_config(self) -> Dict[str, Any]:
         """Get appearance configuration."""
@@ -41,6 +41,12 @@ class DatabaseManager:
             self._local.connection.row_factory = sqlite3.Row
             # Enable foreign keys
             self._local.connection.execute("PRAGMA foreign_keys = ON")
+            # WAL lets UI reads proceed while a background sync is writing;
+            # NORMAL sync is safe under WAL and avoids an fsync per commit
+            self._local.connection.execute("PRAGMA journal_mode = WAL")
+            self._local.connection.execute("PRAGMA synchronous = NORMAL")
+            self._local.connection.execute("PRAGMA temp_store = MEMORY")
+            self._local.connection.execute("PRAGMA mmap_size = 268435456")
         return self._local.connection
     
     def _init_db(self):
@@ -121,7 +127,9 @@ class DatabaseManager:
         -- Indexes for better performance
         CREATE INDEX IF NOT EXISTS idx_messages_chat_guid ON messages (chat_guid);
         CREATE INDEX IF NOT EXISTS idx_messages_date_created ON messages (date_created);
+        CREATE INDEX IF NOT EXISTS idx_messages_chat_date ON messages (chat_guid, date_created);
         CREATE INDEX IF NOT EXISTS idx_messages_handle_id ON messages (handle_id);
+        CREATE INDEX IF NOT EXISTS idx_messages_associated_guid ON messages (associated_message_guid);
         CREATE INDEX IF NOT EXISTS idx_chats_last_message_date ON chats (last_message_date);
         CREATE INDEX IF NOT EXISTS idx_handles_address ON handles (address);
         """)
@@ -332,47 +340,7 @@ class DatabaseManager:
         LIMIT ? OFFSET ?
         """, (chat_guid, limit, offset))
         
-        messages = []
-        for row in cursor.fetchall():
-            # Parse attachments
-            attachments = []
-            if row['attachments_json']:
-                try:
-                    attachments = json.loads(row['attachments_json'])
-                except json.JSONDecodeError:
-                    attachments = []
-            
-            message_record = MessageRecord(
-                original_rowid=row['original_rowid'],
-                guid=row['guid'],
-                text=row['text'],
-                handle_id=row['handle_id'],
-                handle_address=row['handle_address'],
-                chat_guid=row['chat_guid'],
-                date_created=row['date_created'],
-                date_read=row['date_read'],
-                date_delivered=row['date_delivered'],
-                is_from_me=row['is_from_me'],
-                is_delayed=row['is_delayed'],
-                is_auto_reply=row['is_auto_reply'],
-                is_system_message=row['is_system_message'],
-                is_service_message=row['is_service_message'],
-                is_forward=row['is_forward'],
-                is_archived=row['is_archived'],
-                is_audio_message=row['is_audio_message'],
-                has_dd_results=row['has_dd_results'],
-                item_type=row['item_type'],
-                group_title=row['group_title'],
-                group_action_type=row['group_action_type'],
-                is_expired=row['is_expired'],
-                balloon_bundle_id=row['balloon_bundle_id'],
-                associated_message_guid=row['associated_message_guid'],
-                associated_message_type=row['associated_message_type'],
-                expressive_send_style_id=row['expressive_send_style_id'],
-                time_expressive_send_style_id=row['time_expressive_send_style_id'],
-                attachments=attachments
-            )
-            messages.append(message_record)
+        messages = [self._row_to_message(row) for row in cursor.fetchall()]
         
         # Reverse the messages so they're in chronological order (oldest first)
         # Database query gets newest messages first (DESC), but UI expects oldest first
@@ -397,50 +365,109 @@ class DatabaseManager:
         ORDER BY m.date_created ASC
         """, (message_guid, message_guid, message_guid))
         
-        reactions = []
-        for row in cursor.fetchall():
-            # Parse attachments JSON if present
-            attachments = []
-            if row['attachments_json']:
-                try:
-                    attachments = json.loads(row['attachments_json'])
-                except json.JSONDecodeError:
-                    attachments = []
+        return [self._row_to_message(row) for row in cursor.fetchall()]
+    
+    def get_message_reactions_bulk(self, message_guids: List[str]) -> Dict[str, List[MessageRecord]]:
+        """Get reactions for several messages in one pass, keyed by message GUID."""
+        reactions = {}
+        message_guids = list(message_guids)
+        if not message_guids:
+            return reactions
+        
+        conn = self._get_connection()
+        
+        # Match the exact and prefixed ('p:0/', 'bp:0/') forms, like get_message_reactions();
+        # batched to stay under SQLite's bound parameter limit
+        batch_size = 300
+        for start in range(0, len(message_guids), batch_size):
+            candidates = []
+            for guid in message_guids[start:start + batch_size]:
+                candidates.extend((guid, f'p:0/{guid}', f'bp:0/{guid}'))
+            placeholders = ','.join('?' * len(candidates))
             
-            reaction_record = MessageRecord(
-                original_rowid=row['original_rowid'],
-                guid=row['guid'],
-                text=row['text'],
-                handle_id=row['handle_id'],
-                handle_address=row['handle_address'],
-                chat_guid=row['chat_guid'],
-                date_created=row['date_created'],
-                date_read=row['date_read'],
-                date_delivered=row['date_delivered'],
-                is_from_me=row['is_from_me'],
-                is_delayed=row['is_delayed'],
-                is_auto_reply=row['is_auto_reply'],
-                is_system_message=row['is_system_message'],
-                is_service_message=row['is_service_message'],
-                is_forward=row['is_forward'],
-                is_archived=row['is_archived'],
-                is_audio_message=row['is_audio_message'],
-                has_dd_results=row['has_dd_results'],
-                item_type=row['item_type'],
-                group_title=row['group_title'],
-                group_action_type=row['group_action_type'],
-                is_expired=row['is_expired'],
-                balloon_bundle_id=row['balloon_bundle_id'],
-                associated_message_guid=row['associated_message_guid'],
-                associated_message_type=row['associated_message_type'],
-                expressive_send_style_id=row['expressive_send_style_id'],
-                time_expressive_send_style_id=row['time_expressive_send_style_id'],
-                attachments=attachments
-            )
-            reactions.append(reaction_record)
+            cursor = conn.execute(f"""
+            SELECT m.*, h.address as handle_address
+            FROM messages m
+            LEFT JOIN handles h ON m.handle_id = h.original_rowid
+            WHERE m.associated_message_guid IN ({placeholders})
+            AND m.associated_message_type IS NOT NULL
+            ORDER BY m.date_created ASC
+            """, candidates)
+            
+            for row in cursor.fetchall():
+                target = row['associated_message_guid'].split('/', 1)[-1]
+                reactions.setdefault(target, []).append(self._row_to_message(row))
         
         return reactions
     
+    @staticmethod
+    def _row_to_message(row: sqlite3.Row) -> MessageRecord:
+        """Build a MessageRecord from a messages row joined with its handle address."""
+        # Parse attachments JSON if present
+        attachments = []
+        if row['attachments_json']:
+            try:
+                attachments = json.loads(row['attachments_json'])
+            except json.JSONDecodeError:
+                attachments = []
+        
+        return MessageRecord(
+            original_rowid=row['original_rowid'],
+            guid=row['guid'],
+            text=row['text'],
+            handle_id=row['handle_id'],
+            handle_address=row['handle_address'],
+            chat_guid=row['chat_guid'],
+            date_created=row['date_created'],
+            date_read=row['date_read'],
+            date_delivered=row['date_delivered'],
+            is_from_me=row['is_from_me'],
+            is_delayed=row['is_delayed'],
+            is_auto_reply=row['is_auto_reply'],
+            is_system_message=row['is_system_message'],
+            is_service_message=row['is_service_message'],
+            is_forward=row['is_forward'],
+            is_archived=row['is_archived'],
+            is_audio_message=row['is_audio_message'],
+            has_dd_results=row['has_dd_results'],
+            item_type=row['item_type'],
+            group_title=row['group_title'],
+            group_action_type=row['group_action_type'],
+            is_expired=row['is_expired'],
+            balloon_bundle_id=row['balloon_bundle_id'],
+            associated_message_guid=row['associated_message_guid'],
+            associated_message_type=row['associated_message_type'],
+            expressive_send_style_id=row['expressive_send_style_id'],
+            time_expressive_send_style_id=row['time_expressive_send_style_id'],
+            attachments=attachments
+        )
+    
+    def get_latest_message_dates(self, chat_guids: List[str]) -> Dict[str, int]:
+        """Get the newest cached message timestamp for the given chats, keyed by chat GUID."""
+        latest_dates = {}
+        chat_guids = list(chat_guids)
+        if not chat_guids:
+            return latest_dates
+        
+        conn = self._get_connection()
+        
+        # Only the requested chats' entries in idx_messages_chat_date are read;
+        # batched to stay under SQLite's bound parameter limit
+        batch_size = 300
+        for start in range(0, len(chat_guids), batch_size):
+            batch = chat_guids[start:start + batch_size]
+            placeholders = ','.join('?' * len(batch))
+            cursor = conn.execute(f"""
+            SELECT chat_guid, MAX(date_created) AS latest_date
+            FROM messages
+            WHERE chat_guid IN ({placeholders})
+            GROUP BY chat_guid
+            """, batch)
+            for row in cursor.fetchall():
+                latest_dates[row['chat_guid']] = row['latest_date'] or 0
+        
+        return latest_dates
+    
     def get_chat_by_guid(self, chat_guid: str) -> Optional[ChatRecord]:
         """Get a specific chat by its GUID."""
         conn = self._get_connection()
@@ -3,7 +3,7 @@ Database Models
 Data models for database records
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -32,17 +32,24 @@ class ChatRecord:
     last_message_from_me: Optional[bool] = None
     last_message_address: Optional[str] = None
     
+    # Derived display values, computed once in __post_init__
+    display_title: str = field(init=False, repr=False, compare=False)
+    last_message_datetime: Optional[datetime] = field(init=False, repr=False, compare=False)
+    preview_prefix: str = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.participants is None:
             self.participants = []
+        self.display_title = self._compute_display_title()
+        self.last_message_datetime = self._compute_last_message_datetime()
+        self.preview_prefix = self._compute_preview_prefix()
     
     @property
     def is_group_chat(self) -> bool:
         """Check if this is a group chat."""
         return len(self.participants) > 1 if self.participants else False
     
-    @property
-    def display_title(self) -> str:
+    def _compute_display_title(self) -> str:
         """Get the display title for this chat."""
         if self.display_name:
             return self.display_name
@@ -55,12 +62,19 @@ class ChatRecord:
                 
         return self.chat_identifier
     
-    @property
-    def last_message_datetime(self) -> Optional[datetime]:
+    def _compute_last_message_datetime(self) -> Optional[datetime]:
         """Get last message time as a datetime object."""
         if self.last_message_date:
             return datetime.fromtimestamp(self.last_message_date / 1000)
         return None
+    
+    def _compute_preview_prefix(self) -> str:
+        """Get the sender prefix shown before the last message preview."""
+        if self.last_message_from_me:
+            return "You: "
+        if self.last_message_address and self.is_group_chat:
+            return f"{self.last_message_address.partition('@')[0]}: "
+        return ""
 
 @dataclass
 class MessageRecord:
@@ -93,15 +107,31 @@ class MessageRecord:
     expressive_send_style_id: Optional[str] = None
     time_expressive_send_style_id: Optional[str] = None
     attachments: Optional[List[Dict[str, Any]]] = None
+    is_edited: bool = False
+    
+    # Derived display values, computed once in __post_init__
+    datetime_created: datetime = field(init=False, repr=False, compare=False)
+    receipt_state: int = field(init=False, repr=False, compare=False)
+    
+    # receipt_state values
+    RECEIPT_NONE = 0
+    RECEIPT_SENDING = 1
+    RECEIPT_DELIVERED = 2
+    RECEIPT_READ = 3
     
     def __post_init__(self):
         if self.attachments is None:
             self.attachments = []
+        self.datetime_created = datetime.fromtimestamp(self.date_created / 1000)
+        self.receipt_state = self._compute_receipt_state()
     
-    @property
-    def datetime_created(self) -> datetime:
-        """Get message creation time as a datetime object."""
-        return datetime.fromtimestamp(self.date_created / 1000)
+    def _compute_receipt_state(self) -> int:
+        """Get the read receipt state for a sent message."""
+        if not self.is_from_me:
+            return self.RECEIPT_NONE
+        # A read message counts as delivered even if no delivery date was recorded
+        read = bool(self.date_read)
+        return self.RECEIPT_SENDING + (read or bool(self.date_delivered)) + read
     
     @property
     def datetime_read(self) -> Optional[datetime]:
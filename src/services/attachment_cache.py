@@ -106,6 +106,14 @@ class AttachmentCache:
         except Exception as e:
             print(f"Failed to cache attachment {attachment_guid}: {e}")
     
+    def get_cached_path(self, attachment_guid: str) -> Optional[Path]:
+        """Get the on-disk path of a cached attachment, if there is one."""
+        base_path = self._get_cache_path(attachment_guid)
+        for file_path in self.cache_dir.glob(f"{base_path.name}*"):
+            if file_path.is_file():
+                return file_path
+        return None
+    
     def get_cached_metadata(self, attachment_guid: str) -> Optional[Dict[str, Any]]:
         """Get cached attachment metadata."""
         return self._metadata_cache.get(attachment_guid)
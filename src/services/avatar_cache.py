@@ -2,6 +2,7 @@
 
 import os
 import hashlib
+import functools
 from typing import Optional
 from pathlib import Path
 import asyncio
@@ -110,73 +111,79 @@ class AvatarCache:
     
     def generate_initials_avatar(self, name: str, size: int = 40) -> bytes:
         """Generate a simple initials-based avatar as fallback."""
+        return _render_initials_avatar(name, size)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_initials_avatar(name: str, size: int = 40) -> bytes:
+    """Render an initials avatar PNG; memoized since the output only depends on the inputs."""
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+        import io
+    except ImportError:
+        # PIL not available, return None - will use default icon
+        return None
+        
+    try:
+        # Get initials (up to 2 characters)
+        words = name.strip().split()
+        if len(words) >= 2:
+            initials = words[0][0].upper() + words[-1][0].upper()
+        elif len(words) == 1 and words[0]:
+            initials = words[0][0].upper()
+        else:
+            initials = "?"
+        
+        # Generate a color based on the name hash
+        import hashlib
+        name_hash = hashlib.md5(name.encode()).hexdigest()
+        
+        # Use hash to pick a color from a pleasant palette
+        colors = [
+            '#007AFF',  # Blue
+            '#34C759',  # Green  
+            '#FF9500',  # Orange
+            '#FF3B30',  # Red
+            '#AF52DE',  # Purple
+            '#FF2D92',  # Pink
+            '#5AC8FA',  # Light Blue
+            '#FFCC00',  # Yellow
+            '#FF6B35',  # Red Orange
+            '#32D74B',  # Light Green
+        ]
+        
+        color_index = int(name_hash[:2], 16) % len(colors)
+        bg_color = colors[color_index]
+        
+        # Create image
+        img = Image.new('RGB', (size, size), color=bg_color)
+        draw = ImageDraw.Draw(img)
+        
+        # Try to use a nice font, fallback to default
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            import io
-        except ImportError:
-            # PIL not available, return None - will use default icon
-            return None
-            
-        try:
-            # Get initials (up to 2 characters)
-            words = name.strip().split()
-            if len(words) >= 2:
-                initials = words[0][0].upper() + words[-1][0].upper()
-            elif len(words) == 1 and words[0]:
-                initials = words[0][0].upper()
-            else:
-                initials = "?"
-            
-            # Generate a color based on the name hash
-            import hashlib
-            name_hash = hashlib.md5(name.encode()).hexdigest()
-            
-            # Use hash to pick a color from a pleasant palette
-            colors = [
-                '#007AFF',  # Blue
-                '#34C759',  # Green  
-                '#FF9500',  # Orange
-                '#FF3B30',  # Red
-                '#AF52DE',  # Purple
-                '#FF2D92',  # Pink
-                '#5AC8FA',  # Light Blue
-                '#FFCC00',  # Yellow
-                '#FF6B35',  # Red Orange
-                '#32D74B',  # Light Green
-            ]
-            
-            color_index = int(name_hash[:2], 16) % len(colors)
-            bg_color = colors[color_index]
-            
-            # Create image
-            img = Image.new('RGB', (size, size), color=bg_color)
-            draw = ImageDraw.Draw(img)
-            
-            # Try to use a nice font, fallback to default
+            font = ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf", size//2)
+        except:
             try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf", size//2)
+                font = ImageFont.truetype("/usr/share/fonts/TTF/DejaVuSans-Bold.ttf", size//2)
             except:
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/TTF/DejaVuSans-Bold.ttf", size//2)
-                except:
-                    font = ImageFont.load_default()
-            
-            # Get text bounding box and center it
-            bbox = draw.textbbox((0, 0), initials, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
-            x = (size - text_width) // 2
-            y = (size - text_height) // 2
-            
-            draw.text((x, y), initials, fill='white', font=font)
-            
-            # Convert to bytes
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            
-            return buffer.getvalue()
-            
-        except Exception as e:
-            # Handle any errors in avatar generation
-            return None
\ No newline at end of file
+                font = ImageFont.load_default()
+        
+        # Get text bounding box and center it
+        bbox = draw.textbbox((0, 0), initials, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        
+        x = (size - text_width) // 2
+        y = (size - text_height) // 2
+        
+        draw.text((x, y), initials, fill='white', font=font)
+        
+        # Convert to bytes
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG')
+        
+        return buffer.getvalue()
+        
+    except Exception as e:
+        # Handle any errors in avatar generation
+        return None
\ No newline at end of file
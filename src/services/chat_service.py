@@ -4,7 +4,7 @@ Handles chat data synchronization between API and database
 """
 
 import asyncio
-import threading
+from contextlib import asynccontextmanager
 from typing import List, Optional, Dict, Any
 from ..api.client import BlueBubblesClient, BlueBubblesAPIError
 from ..db.manager import DatabaseManager
@@ -16,15 +16,81 @@ from .attachment_cache import AttachmentCache
 class ChatService:
     """Service for managing chat data synchronization."""
     
-    def __init__(self, db_manager: DatabaseManager, config_manager: ConfigManager):
+    def __init__(self, db_manager: DatabaseManager, config_manager: ConfigManager,
+                 app_loop: asyncio.AbstractEventLoop):
         self.db_manager = db_manager
         self.config_manager = config_manager
+        self.app_loop = app_loop
         self._message_check_task = None
-        self._message_check_thread = None
         self.avatar_cache = AvatarCache()
         self.attachment_cache = AttachmentCache()
         self._stop_message_check = False
         self._message_check_callbacks = []
+        # Open API clients keyed by (server_url, password, api_method)
+        self._clients = {}
+        # Number of client() blocks using each client
+        self._client_users = {}
+        # Clients for old settings, closed once their last user is done
+        self._retired_clients = set()
+    
+    @asynccontextmanager
+    async def client(self, server_url: str, password: str, api_method: Optional[str] = None):
+        """
+        Borrow the shared API client for a server.
+        
+        The client's HTTP session stays open after the block so later calls
+        reuse its pooled connections; close_clients() releases it. When the
+        server settings change, clients for the old ones are retired and
+        closed after the blocks still using them finish. Must be used from
+        the application's event loop.
+        """
+        if api_method is None:
+            api_method = self.config_manager.get_api_method()
+        
+        key = (server_url, password, api_method)
+        client = self._clients.get(key)
+        idle_clients = []
+        if client is None or client.session is None or client.session.closed:
+            # Server settings changed; retire the clients for the old ones
+            idle_clients = self._retire_clients()
+            client = BlueBubblesClient(server_url, password, api_method)
+            await client.open()
+            self._clients[key] = client
+        
+        # Count this user before awaiting anything else so the client can't be
+        # closed underneath it
+        self._client_users[client] = self._client_users.get(client, 0) + 1
+        try:
+            for old_client in idle_clients:
+                await old_client.close()
+            yield client
+        finally:
+            self._client_users[client] -= 1
+            if not self._client_users[client]:
+                del self._client_users[client]
+                if client in self._retired_clients:
+                    self._retired_clients.discard(client)
+                    await client.close()
+    
+    def _retire_clients(self) -> list:
+        """Drop every pooled client; returns the idle ones for the caller to close."""
+        idle_clients = []
+        for client in self._clients.values():
+            if self._client_users.get(client):
+                # Still in use; the last block using it closes it
+                self._retired_clients.add(client)
+            else:
+                idle_clients.append(client)
+        self._clients.clear()
+        return idle_clients
+    
+    async def close_clients(self):
+        """Close every shared API client, including retired ones still in use."""
+        clients = list(self._clients.values()) + list(self._retired_clients)
+        self._clients.clear()
+        self._retired_clients.clear()
+        for client in clients:
+            await client.close()
     
     async def sync_chats_from_server(self, server_url: str, password: str, 
                                    limit: int = 100) -> List[ChatRecord]:
@@ -41,7 +107,7 @@ class ChatService:
         """
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 # Fetch chats with participants data
                 chats_data = await client.get_chats(
                     limit=limit, 
@@ -80,7 +146,7 @@ class ChatService:
         """
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 # Fetch messages with handle data
                 messages_data = await client.get_chat_messages(
                     chat_guid, 
@@ -116,6 +182,10 @@ class ChatService:
         """Get reactions for a specific message from cache."""
         return self.db_manager.get_message_reactions(message_guid)
     
+    def get_message_reactions_bulk(self, message_guids: List[str]) -> Dict[str, List[MessageRecord]]:
+        """Get reactions for several messages from cache, keyed by message GUID."""
+        return self.db_manager.get_message_reactions_bulk(message_guids)
+    
     def get_chat_by_guid(self, chat_guid: str) -> Optional[ChatRecord]:
         """Get a specific chat by GUID from the cache."""
         return self.db_manager.get_chat_by_guid(chat_guid)
@@ -157,7 +227,7 @@ class ChatService:
         """Send a text message to a chat."""
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 await client.send_message(chat_guid, message)
                 # Refresh messages after sending
                 await self.sync_chat_messages(server_url, password, chat_guid, limit=10)
@@ -171,7 +241,7 @@ class ChatService:
         """Send an attachment to a chat."""
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 await client.send_attachment(chat_guid, file_path, message)
                 # Refresh messages after sending
                 await self.sync_chat_messages(server_url, password, chat_guid, limit=10)
@@ -186,7 +256,7 @@ class ChatService:
         try:
             api_method = self.config_manager.get_api_method()
             # print(f"🎭 Sending reaction: message_guid={message_guid}, reaction_type={reaction_type}, chat_guid={chat_guid}, api_method={api_method}")
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 result = await client.send_reaction(message_guid, reaction_type, chat_guid)
                 # print(f"🎭 Reaction API response: {result}")
             # Proactively sync messages so UI can immediately reflect the reaction badge
@@ -208,7 +278,7 @@ class ChatService:
         try:
             api_method = self.config_manager.get_api_method()
             # print(f"🎭 Removing reaction: message_guid={message_guid}, chat_guid={chat_guid}, api_method={api_method}")
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 result = await client.remove_reaction(message_guid, chat_guid)
                 # print(f"🎭 Remove reaction API response: {result}")
             # Proactively sync messages so UI can immediately reflect the removed badge
@@ -228,7 +298,7 @@ class ChatService:
         """Send typing indicator to a chat."""
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 return await client.send_typing_indicator(chat_guid, typing)
         except Exception as e:
             # print(f"Error sending typing indicator: {e}")
@@ -239,7 +309,7 @@ class ChatService:
         """Unsend a message."""
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 await client.unsend_message(message_guid)
                 # Refresh messages after unsending
                 await self.sync_chat_messages(server_url, password, chat_guid, limit=10)
@@ -253,7 +323,7 @@ class ChatService:
         """Edit a message."""
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 await client.edit_message(message_guid, new_text)
                 # Refresh messages after editing
                 await self.sync_chat_messages(server_url, password, chat_guid, limit=10)
@@ -272,7 +342,7 @@ class ChatService:
             self._message_check_callbacks.remove(callback)
     
     def start_message_checking(self, server_url: str, password: str, check_interval: int = 3):
-        """Start the background message checking task."""
+        """Start the background message checking task on the shared app loop."""
         if self._message_check_task is not None:
             # print("⚠️  Message checking task is already running")
             return
@@ -280,106 +350,92 @@ class ChatService:
         self._stop_message_check = False
         # print(f"🔄 Starting message checking with {check_interval}s interval")
         
-        async def message_check_loop():
-            """Background task to periodically check for new messages."""
-            while not self._stop_message_check:
-                try:
-                    # Get all cached chats
-                    cached_chats = self.get_cached_chats(limit=50)
+        self._message_check_task = asyncio.run_coroutine_threadsafe(
+            self._message_check_loop(server_url, password, check_interval),
+            self.app_loop
+        )
+    
+    async def _message_check_loop(self, server_url: str, password: str, check_interval: int):
+        """Background task to periodically check for new messages."""
+        while not self._stop_message_check:
+            try:
+                # Get all cached chats
+                cached_chats = self.get_cached_chats(limit=50)
+                
+                # Latest cached timestamp per polled chat, fetched in a single query
+                latest_by_guid = self.db_manager.get_latest_message_dates(
+                    [chat.guid for chat in cached_chats]
+                )
+                
+                for chat in cached_chats:
+                    if self._stop_message_check:
+                        break
                     
-                    for chat in cached_chats:
-                        if self._stop_message_check:
-                            break
-                        
-                        # Get current message count for this chat
-                        current_messages = self.get_cached_chat_messages(chat.guid, limit=1)
-                        current_count = len(current_messages)
-                        
-                        # Check for new messages on server
-                        try:
-                            api_method = self.config_manager.get_api_method()
-                            async with BlueBubblesClient(server_url, password, api_method) as client:
-                                new_messages = await client.get_chat_messages(chat.guid, limit=5)
+                    # Check for new messages on server
+                    try:
+                        api_method = self.config_manager.get_api_method()
+                        async with self.client(server_url, password, api_method) as client:
+                            new_messages = await client.get_chat_messages(chat.guid, limit=5)
+                            
+                            if len(new_messages) > 0:
+                                # Get the latest message timestamp from our cache
+                                latest_cached_timestamp = latest_by_guid.get(chat.guid, 0)
+                                
+                                # Check if any new messages are newer than our latest cached message
+                                new_message_found = False
+                                for msg_data in new_messages:
+                                    msg_timestamp = msg_data.get('dateCreated', 0)
+                                    if msg_timestamp > latest_cached_timestamp:
+                                        # Save new message to database
+                                        self.db_manager.save_message(msg_data, chat.guid)
+                                        new_message_found = True
+                                        # print(f"📨 New message detected in chat {chat.display_name or chat.guid[:8]}")
                                 
-                                if len(new_messages) > 0:
-                                    # Get the latest message timestamp from our cache
-                                    latest_cached_timestamp = 0
-                                    if current_messages:
-                                        latest_cached_timestamp = current_messages[0].date_created
-                                    
-                                    # Check if any new messages are newer than our latest cached message
-                                    new_message_found = False
-                                    for msg_data in new_messages:
-                                        msg_timestamp = msg_data.get('dateCreated', 0)
-                                        if msg_timestamp > latest_cached_timestamp:
-                                            # Save new message to database
-                                            self.db_manager.save_message(msg_data, chat.guid)
-                                            new_message_found = True
-                                            # print(f"📨 New message detected in chat {chat.display_name or chat.guid[:8]}")
-                                    
-                                    # Notify callbacks if new messages were found
-                                    if new_message_found:
-                                        for callback in self._message_check_callbacks:
-                                            try:
-                                                callback(chat.guid)
-                                            except Exception as e:
-                                                # print(f"❌ Error in message callback: {e}")
-                                                pass
-                        
-                        except Exception as e:
-                            # Don't # print errors for individual chats as it can be spammy
-                            pass
+                                # Notify callbacks if new messages were found
+                                if new_message_found:
+                                    for callback in self._message_check_callbacks:
+                                        try:
+                                            callback(chat.guid)
+                                        except Exception as e:
+                                            # print(f"❌ Error in message callback: {e}")
+                                            pass
                     
-                    # Wait before next check
-                    await asyncio.sleep(check_interval)
+                    except Exception as e:
+                        # Don't # print errors for individual chats as it can be spammy
+                        pass
                 
-                except Exception as e:
-                    # print(f"❌ Error in message checking loop: {e}")
-                    await asyncio.sleep(check_interval)
+                # Wait before next check
+                await asyncio.sleep(check_interval)
             
-            # print("🛑 Message checking stopped")
-        
-        # Start the background task by running the async function in a thread
-        def run_async_loop():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(message_check_loop())
-            except asyncio.CancelledError:
-                # print("🛑 Message checking task cancelled")
-                pass
             except Exception as e:
-                # print(f"❌ Error in message checking thread: {e}")
-                pass
-            finally:
-                loop.close()
+                # print(f"❌ Error in message checking loop: {e}")
+                await asyncio.sleep(check_interval)
         
-        self._message_check_thread = threading.Thread(target=run_async_loop, daemon=True)
-        self._message_check_thread.start()
+        # print("🛑 Message checking stopped")
     
     def stop_message_checking(self):
         """Stop the background message checking task."""
-        if self._message_check_task is None and self._message_check_thread is None:
+        if self._message_check_task is None:
             return
         
         # print("🛑 Stopping message checking...")
         self._stop_message_check = True
         
-        if self._message_check_task and not self._message_check_task.done():
+        if not self._message_check_task.done():
             self._message_check_task.cancel()
         
-        # Wait a bit for the thread to finish
-        if self._message_check_thread and self._message_check_thread.is_alive():
-            self._message_check_thread.join(timeout=2.0)
-        
         self._message_check_task = None
-        self._message_check_thread = None
     
     async def get_contact_avatar(self, server_url: str, password: str, address: str) -> Optional[bytes]:
         """Get contact avatar from server or cache."""
+        # Serve cached avatars without opening a client session
+        cached = self.avatar_cache.get_cached_avatar(address, is_group=False)
+        if cached:
+            return cached
+        
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 return await self.avatar_cache.get_avatar(client, address, is_group=False)
         except Exception as e:
             # Silently handle avatar fetch errors
@@ -387,9 +443,14 @@ class ChatService:
     
     async def get_chat_icon(self, server_url: str, password: str, chat_guid: str) -> Optional[bytes]:
         """Get group chat icon from server or cache."""
+        # Serve cached icons without opening a client session
+        cached = self.avatar_cache.get_cached_avatar(chat_guid, is_group=True)
+        if cached:
+            return cached
+        
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 return await self.avatar_cache.get_avatar(client, chat_guid, is_group=True)
         except Exception as e:
             # Silently handle avatar fetch errors
@@ -403,7 +464,7 @@ class ChatService:
         """Mark a chat as read."""
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 return await client.mark_chat_read(chat_guid)
         except Exception as e:
             # Silently handle mark read errors
@@ -413,12 +474,19 @@ class ChatService:
         """Get attachment data from server or cache."""
         try:
             api_method = self.config_manager.get_api_method()
-            async with BlueBubblesClient(server_url, password, api_method) as client:
+            async with self.client(server_url, password, api_method) as client:
                 return await self.attachment_cache.get_attachment(client, attachment_guid)
         except Exception as e:
             # Silently handle attachment fetch errors
             return None
     
+    async def get_attachment_path(self, server_url: str, password: str, attachment_guid: str) -> Optional[str]:
+        """Download an attachment into the cache if needed and return its file path."""
+        if not await self.get_attachment(server_url, password, attachment_guid):
+            return None
+        path = self.attachment_cache.get_cached_path(attachment_guid)
+        return str(path) if path else None
+    
     def get_attachment_metadata(self, attachment_guid: str) -> Optional[Dict[str, Any]]:
         """Get cached attachment metadata."""
         return self.attachment_cache.get_cached_metadata(attachment_guid)
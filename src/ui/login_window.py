@@ -22,6 +22,9 @@ class LoginWindow(Adw.ApplicationWindow):
         self.set_default_size(480, 360)
         self.set_resizable(False)
         
+        # Pending input validation timeout (debounces keystrokes)
+        self._validate_source = 0
+        
         # Build UI
         self.setup_ui()
         
@@ -139,13 +142,22 @@ class LoginWindow(Adw.ApplicationWindow):
             self.password_row.set_text(config['password'])
     
     def on_input_changed(self, widget, param):
-        """Handle input changes to enable/disable buttons."""
+        """Handle input changes, validating once typing pauses."""
+        if self._validate_source:
+            GLib.source_remove(self._validate_source)
+        self._validate_source = GLib.timeout_add(100, self._do_validate)
+    
+    def _do_validate(self):
+        """Enable/disable buttons based on the current input."""
+        self._validate_source = 0
+        
         url = self.url_row.get_text().strip()
         password = self.password_row.get_text().strip()
         
         has_input = bool(url and password and url != "http://")
         self.test_button.set_sensitive(has_input)
         self.connect_button.set_sensitive(has_input)
+        return GLib.SOURCE_REMOVE
     
     def show_toast(self, message: str, timeout: int = 3):
         """Show a toast notification."""
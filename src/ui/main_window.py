@@ -9,17 +9,113 @@ gi.require_version('Adw', '1')
 
 from gi.repository import Gtk, Adw, GLib, Gio, GObject, Gdk
 import asyncio
+import functools
+import logging
+import queue
 import threading
+import time
 import os
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from ..api.client import BlueBubblesClient, BlueBubblesAPIError
-from ..db.models import ChatRecord
+from ..api.client import BlueBubblesAPIError
+from ..db.models import ChatRecord, MessageRecord
 from .new_chat_dialog import NewChatDialog
 
+logger = logging.getLogger(__name__)
+
+# (status_text, css_class) indexed by MessageRecord.receipt_state
+_RECEIPT_TABLE = (
+    ("", ""),                       # Not sent by us; no receipt shown
+    ("🕒 Sending...", "sending"),   # Still sending or failed
+    ("✓ Delivered", "delivered"),   # Delivered but not read
+    ("✓✓ Read", "read"),            # Read
+)
+
+# (icon_name, css_class) for attachments, keyed by the MIME type's top-level category
+_MIME_CATEGORY_ICONS = {
+    "image": ("image-x-generic", "attachment-image"),
+    "video": ("video-x-generic", "attachment-video"),
+    "audio": ("audio-x-generic", "attachment-audio"),
+}
+_MIME_PDF_ICON = ("application-pdf", "attachment-document")
+_MIME_DEFAULT_ICON = ("text-x-generic", "attachment-document")
+
+# (divisor, suffix) indexed by (bit_length - 1) // 10, i.e. by power of 1024
+_SIZE_UNITS = (
+    (1, "B"),
+    (1024, "KB"),
+    (1024 ** 2, "MB"),
+    (1024 ** 3, "GB"),
+)
+
+# (emoji, reaction_type) for every tapback, in the order the reaction picker shows them;
+# BlueBubbles also reports them by numeric type, starting at 2000 in this order
+_REACTIONS = (
+    ("❤️", "love"),
+    ("👍", "like"),
+    ("👎", "dislike"),
+    ("😂", "laugh"),
+    ("‼️", "emphasis"),
+    ("❓", "question"),
+)
+
+# Map BlueBubbles reaction types, numeric or by name, to emojis
+_REACTION_EMOJI = {
+    **{str(2000 + i): emoji for i, (emoji, _) in enumerate(_REACTIONS)},
+    **{reaction_type: emoji for emoji, reaction_type in _REACTIONS},
+}
+
+@dataclass(frozen=True)
+class ChatViewHandles:
+    """Widgets of a chat view that are looked up after it is built."""
+    messages_box: Gtk.Box
+    messages_area: Gtk.ScrolledWindow
+    message_entry: Gtk.Entry
+
+
+class ChatListItem(GObject.Object):
+    """GObject wrapper that lets a ChatRecord live in a Gio.ListStore."""
+    
+    __gtype_name__ = 'BlueBubblesChatListItem'
+    
+    def __init__(self, chat: ChatRecord):
+        super().__init__()
+        self.chat = chat
+        self.row = None  # Row widget while the item is bound in the ListView
+
 class MainWindow(Adw.ApplicationWindow):
     """Main application window."""
     
+    # Minimum seconds between background chat syncs (app.min_sync_interval)
+    MIN_SYNC_INTERVAL = 5
+    
+    # Maximum number of decoded avatar textures kept in memory
+    AVATAR_CACHE_SIZE = 256
+    
+    # Maximum number of chat views kept alive in the content stack
+    CHAT_VIEW_CACHE_SIZE = 8
+    
+    # Maximum number of message widgets kept in a chat's messages box
+    MAX_MESSAGE_WIDGETS = 200
+    
+    # Seconds of inactivity before the typing indicator is cleared
+    TYPING_TIMEOUT = 3
+    
+    # Maximum number of posted UI callbacks run per main loop iteration
+    UI_DRAIN_BATCH = 32
+    
+    # Milliseconds to collect new-message notifications before updating the UI
+    NEW_MESSAGE_DEBOUNCE_MS = 100
+    
+    # Maximum number of queued server actions (mark read, reactions, edits)
+    ACTION_QUEUE_SIZE = 64
+    
+    # MIME types accepted by the attachment picker
+    IMAGE_MIME_TYPES = ("image/jpeg", "image/png", "image/gif", "image/webp", "image/heic")
+    
     def __init__(self, application):
         super().__init__(application=application)
         
@@ -30,20 +126,70 @@ class MainWindow(Adw.ApplicationWindow):
         self.config_manager = application.config_manager
         self.chat_service = application.get_chat_service()
         
+        # Async work runs on the application's shared event loop
+        self._loop = application.app_loop
+        self._pending_futures = set()
+        
+        # Server actions run one at a time, in order, by a worker on the loop;
+        # created there on first use, and only touched from the loop thread
+        self._action_queue = None
+        self._action_worker_task = None
+        # Key of the last action queued, while it is still waiting to run
+        self._last_queued_action_key = None
+        
+        # Callbacks posted from worker threads, drained on the GTK main loop
+        self._ui_queue = queue.SimpleQueue()
+        self._ui_drain_lock = threading.Lock()
+        self._ui_drain_scheduled = False
+        
+        # Decoded avatar textures keyed by (kind, identifier), least recently used first
+        self._avatar_cache = OrderedDict()
+        # Avatar fetches in progress: key -> [(image widget, token, chat GUID)]
+        self._inflight_avatars = {}
+        
+        # Built chat views keyed by chat GUID, least recently used first
+        self._chat_view_lru = OrderedDict()
+        
+        # Message popovers, built on first use and shared by all bubbles
+        self._reaction_popover = None
+        self._image_file_dialog = None
+        self._clipboard = None
+        self._context_popover = None
+        
+        # Server URL/password, cached until the config changes
+        self._server_config = None
+        self.config_manager.add_change_callback(self.on_config_changed)
+        
+        # Shared "now" for timestamps formatted in the same main loop iteration
+        self._batch_now = None
+        
         # Store chat data
         self.chats = []
+        self._chat_index = {}  # chat GUID -> position in self.chats / chat_store
         self.current_chat = None
+        self._restoring_selection = False
+        
+        # Chat sync coalescing state
+        self._sync_lock = threading.Lock()
+        self._sync_in_flight = False
+        self._sync_pending = False
+        self._last_sync = 0.0
         
         # Typing indicator state
-        self.typing_timeout_id = None
         self.is_typing = False
+        self._last_typing_sent = None
+        self._typing_deadline = 0.0
+        self._typing_tick_id = 0
+        
+        # Chats with new messages waiting for the debounced UI update, in arrival order
+        self._pending_new_chats = {}
+        self._new_message_flush_id = 0
         
         # Connect to window destroy signal for cleanup
         self.connect("destroy", self.on_window_destroy)
         
         # Build UI
         self.setup_ui()
-        self.load_styles()
         
         # Load data
         self.load_server_info()
@@ -52,46 +198,66 @@ class MainWindow(Adw.ApplicationWindow):
         # Start background message checking
         self.start_message_monitoring()
     
-    def load_styles(self):
-        """Load custom CSS styles for this window."""
-        try:
-            css_provider = Gtk.CssProvider()
-            css_path = Path(__file__).parent / 'styles.css'
-            css_provider.load_from_path(str(css_path))
-            
-            # Apply to this window's display
-            display = self.get_display()
-            if display:
-                Gtk.StyleContext.add_provider_for_display(
-                    display,
-                    css_provider,
-                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                )
-        except Exception as e:
-            pass  # Silently handle CSS loading errors
+    def get_server_config(self) -> dict:
+        """Get the server configuration, cached until it changes."""
+        if self._server_config is None:
+            self._server_config = self.config_manager.get_server_config()
+        return self._server_config
+    
+    def on_config_changed(self, key: str):
+        """Drop the cached server configuration when a server setting changes."""
+        if key.split('.', 1)[0] == 'server':
+            self._server_config = None
+    
+    def _post_ui(self, callback, *args):
+        """Run a callback on the GTK main loop; safe to call from any thread."""
+        self._ui_queue.put((callback, args))
+        with self._ui_drain_lock:
+            if self._ui_drain_scheduled:
+                return
+            self._ui_drain_scheduled = True
+        GLib.idle_add(self._drain_ui_queue)
     
-    def load_image_from_data(self, image_data: bytes, size: int = 40) -> Gtk.Image:
-        """Load image data into a Gtk.Image widget."""
-        try:
-            # Create a GBytes object from the image data
-            gbytes = GLib.Bytes.new(image_data)
-            
-            # Create a texture from the bytes
-            texture = Gdk.Texture.new_from_bytes(gbytes)
-            
-            # Create the image widget
-            image = Gtk.Image.new_from_paintable(texture)
-            image.set_pixel_size(size)
-            image.add_css_class("circular")
-            
-            return image
-        except Exception as e:
-            # Fallback to default icon on error
-            image = Gtk.Image()
-            image.set_from_icon_name("person-symbolic")
-            image.set_pixel_size(size)
-            image.add_css_class("circular")
-            return image
+    def _drain_ui_queue(self):
+        """Run queued UI callbacks, a bounded batch per main loop iteration."""
+        for _ in range(self.UI_DRAIN_BATCH):
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                # Keep draining the batch, but don't hide the failure
+                logger.exception("UI callback %r failed", callback)
+        
+        with self._ui_drain_lock:
+            if self._ui_queue.empty():
+                self._ui_drain_scheduled = False
+                return False  # Remove from idle queue
+        return True  # More callbacks are waiting
+    
+    def _submit(self, coro, on_done=None, on_error=None):
+        """Schedule a coroutine on the shared event loop and track it until done.
+        
+        on_done(result) and on_error(exception) are called on the GTK main loop.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        self._pending_futures.add(future)
+        
+        def finished(f):
+            self._pending_futures.discard(f)
+            if f.cancelled():
+                return
+            error = f.exception()
+            if error is not None:
+                if on_error:
+                    self._post_ui(on_error, error)
+            elif on_done:
+                self._post_ui(on_done, f.result())
+        
+        future.add_done_callback(finished)
+        return future
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -125,12 +291,23 @@ class MainWindow(Adw.ApplicationWindow):
         # Create main sidebar container
         sidebar_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         
-        # Chat list in scrolled window
+        # Chat list in scrolled window; ListView recycles row widgets so only
+        # the visible rows are ever built
         sidebar_content = Gtk.ScrolledWindow()
         sidebar_content.set_vexpand(True)
-        self.chat_list = Gtk.ListBox()
+        self.chat_store = Gio.ListStore.new(ChatListItem)
+        self.chat_selection = Gtk.SingleSelection(model=self.chat_store)
+        self.chat_selection.set_autoselect(False)
+        self.chat_selection.set_can_unselect(True)
+        self.chat_selection.connect("notify::selected", self.on_chat_selected)
+        
+        chat_factory = Gtk.SignalListItemFactory()
+        chat_factory.connect("setup", self.on_chat_row_setup)
+        chat_factory.connect("bind", self.on_chat_row_bind)
+        chat_factory.connect("unbind", self.on_chat_row_unbind)
+        
+        self.chat_list = Gtk.ListView(model=self.chat_selection, factory=chat_factory)
         self.chat_list.add_css_class("navigation-sidebar")
-        self.chat_list.connect("row-selected", self.on_chat_selected)
         sidebar_content.set_child(self.chat_list)
         sidebar_container.append(sidebar_content)
         
@@ -213,34 +390,51 @@ class MainWindow(Adw.ApplicationWindow):
     
     def load_chats(self, force_refresh: bool = False):
         """Load chats from cache or server."""
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             return
         
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+        # Collapse overlapping requests into one follow-up sync
+        with self._sync_lock:
+            if self._sync_in_flight:
+                self._sync_pending = True
+                return
+            self._sync_in_flight = True
+        
+        self._submit(self.sync_chats_coalesced(config['url'], config['password'], force_refresh))
+    
+    async def sync_chats_coalesced(self, server_url: str, password: str, refresh: bool):
+        """Load chats, then rerun once if more loads were requested meanwhile."""
+        try:
+            while True:
+                try:
+                    if refresh:
+                        # Fetch from server
+                        await self.load_chats_from_server_async(server_url, password)
+                    else:
+                        # Try cache first, fallback to server
+                        await self.load_chats_async(server_url, password)
+                except Exception as e:
+                    error = str(e)
+                    def show_error():
+                        self.show_toast(f"Failed to load chats: {error}")
+                    self._post_ui(show_error)
                 
-                if force_refresh:
-                    # Fetch from server
-                    loop.run_until_complete(
-                        self.load_chats_from_server_async(config['url'], config['password'])
-                    )
-                else:
-                    # Try cache first, fallback to server
-                    loop.run_until_complete(
-                        self.load_chats_async(config['url'], config['password'])
-                    )
+                with self._sync_lock:
+                    if not self._sync_pending:
+                        self._sync_in_flight = False
+                        break
+                    self._sync_pending = False
                 
-                loop.close()
-            except Exception as e:
-                def show_error():
-                    self.show_toast(f"Failed to load chats: {str(e)}")
-                GLib.idle_add(show_error)
-        
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+                # Let a burst of refresh requests settle, then sync once more
+                await asyncio.sleep(0.25)
+                refresh = True
+        except BaseException:
+            # Cancelled on window close; let the next load start fresh
+            with self._sync_lock:
+                self._sync_in_flight = False
+                self._sync_pending = False
+            raise
     
     async def load_chats_async(self, server_url: str, password: str):
         """Load chats, preferring cache but falling back to server."""
@@ -251,24 +445,27 @@ class MainWindow(Adw.ApplicationWindow):
             if cached_chats:
                 # Update UI with cached chats
                 def update_ui():
-                    self.chats = cached_chats
-                    self.populate_chat_list()
+                    self.update_chats(cached_chats)
                 
-                GLib.idle_add(update_ui)
+                self._post_ui(update_ui)
+                
+                # Optionally sync in background, unless we synced very recently
+                min_interval = self.config_manager.get('app.min_sync_interval', self.MIN_SYNC_INTERVAL)
+                if time.monotonic() - self._last_sync < min_interval:
+                    return
                 
-                # Optionally sync in background
                 try:
                     updated_chats = await self.chat_service.sync_chats_from_server(
                         server_url, password, limit=100
                     )
+                    self._last_sync = time.monotonic()
                     
                     # Update UI if we got different data
                     if len(updated_chats) != len(cached_chats):
                         def update_ui_again():
-                            self.chats = updated_chats
-                            self.populate_chat_list()
+                            self.update_chats(updated_chats)
                         
-                        GLib.idle_add(update_ui_again)
+                        self._post_ui(update_ui_again)
                         
                 except Exception as sync_error:
                     pass  # Silently handle background sync errors
@@ -280,7 +477,7 @@ class MainWindow(Adw.ApplicationWindow):
             def show_error():
                 self.show_toast(f"Failed to load chats: {str(e)}")
             
-            GLib.idle_add(show_error)
+            self._post_ui(show_error)
     
     async def load_chats_from_server_async(self, server_url: str, password: str):
         """Load chats from server and update UI."""
@@ -288,43 +485,104 @@ class MainWindow(Adw.ApplicationWindow):
             chats = await self.chat_service.sync_chats_from_server(
                 server_url, password, limit=100
             )
+            self._last_sync = time.monotonic()
             
             def update_ui():
-                self.chats = chats
-                self.populate_chat_list()
+                self.update_chats(chats)
                 if chats:
                     self.show_toast(f"Loaded {len(chats)} chats")
                 else:
                     self.show_toast("No chats found")
             
-            GLib.idle_add(update_ui)
+            self._post_ui(update_ui)
             
         except Exception as e:
             def show_error():
                 self.show_toast(f"Failed to load chats from server: {str(e)}")
             
-            GLib.idle_add(show_error)
+            self._post_ui(show_error)
     
     def populate_chat_list(self):
         """Populate the chat list with chat data."""
-        # Clear existing items
-        while True:
-            row = self.chat_list.get_first_child()
-            if row is None:
-                break
-            self.chat_list.remove(row)
-        
-        # Add chat items
-        for chat in self.chats:
-            chat_row = self.create_chat_row(chat)
-            self.chat_list.append(chat_row)
-    
-    def create_chat_row(self, chat: ChatRecord) -> Gtk.ListBoxRow:
-        """Create a chat list row."""
-        row = Gtk.ListBoxRow()
-        # Store chat data as an attribute instead of using set_data
-        row.chat = chat
+        items = [ChatListItem(chat) for chat in self.chats]
+        self.chat_store.splice(0, self.chat_store.get_n_items(), items)
+        self.reindex_chats()
+    
+    def reindex_chats(self, stop: int = None):
+        """Rebuild the chat GUID -> position lookup, or just its first stop entries."""
+        if stop is None:
+            self._chat_index = {chat.guid: i for i, chat in enumerate(self.chats)}
+            return
         
+        index = self._chat_index
+        chats = self.chats
+        for i in range(min(stop, len(chats))):
+            index[chats[i].guid] = i
+    
+    def update_chats(self, new_chats):
+        """Update the chat list in place, only touching rows that changed."""
+        store = self.chat_store
+        old_count = store.get_n_items()
+        new_count = len(new_chats)
+        
+        # Skip the unchanged head and tail of the list
+        start = 0
+        while (start < old_count and start < new_count
+               and store.get_item(start).chat.guid == new_chats[start].guid):
+            start += 1
+        
+        end_old, end_new = old_count, new_count
+        while (end_old > start and end_new > start
+               and store.get_item(end_old - 1).chat.guid == new_chats[end_new - 1].guid):
+            end_old -= 1
+            end_new -= 1
+        
+        # Rows that kept their position only need their labels refreshed
+        for position in list(range(start)) + list(range(end_old, old_count)):
+            item = store.get_item(position)
+            chat = new_chats[position if position < start else position - end_old + end_new]
+            if item.chat != chat:
+                item.chat = chat
+                if item.row is not None:
+                    self.bind_chat_row(item.row, chat)
+        
+        # Replace the differing middle section in one splice
+        if start < end_old or start < end_new:
+            added = [ChatListItem(chat) for chat in new_chats[start:end_new]]
+            store.splice(start, end_old - start, added)
+        
+        self.chats = list(new_chats)
+        self.reindex_chats()
+        
+        # Point the open chat at its fresh record, and keep it selected if
+        # the splice dropped its row
+        if self.current_chat:
+            position = self._chat_index.get(self.current_chat.guid)
+            if position is not None:
+                self.current_chat = self.chats[position]
+            if position is not None and self.chat_selection.get_selected() != position:
+                self._restoring_selection = True
+                try:
+                    self.chat_selection.set_selected(position)
+                finally:
+                    self._restoring_selection = False
+    
+    def on_chat_row_setup(self, factory, list_item):
+        """Build the widgets for a chat list row once; rows are recycled."""
+        list_item.set_child(self.create_chat_row())
+    
+    def on_chat_row_bind(self, factory, list_item):
+        """Fill a recycled chat list row with its chat's data."""
+        item = list_item.get_item()
+        item.row = list_item.get_child()
+        self.bind_chat_row(item.row, item.chat)
+    
+    def on_chat_row_unbind(self, factory, list_item):
+        """Forget the row widget once it is recycled for another chat."""
+        list_item.get_item().row = None
+    
+    def create_chat_row(self) -> Gtk.Widget:
+        """Create an empty chat list row; contents are set by bind_chat_row."""
         # Main container
         main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         main_box.set_margin_start(12)
@@ -334,17 +592,10 @@ class MainWindow(Adw.ApplicationWindow):
         
         # Avatar (will be loaded asynchronously)
         avatar = Gtk.Image()
-        if chat.is_group_chat:
-            avatar.set_from_icon_name("group-symbolic")
-        else:
-            avatar.set_from_icon_name("person-symbolic")
         avatar.add_css_class("circular")
         avatar.set_pixel_size(40)
         main_box.append(avatar)
         
-        # Load avatar asynchronously
-        self.load_chat_avatar_async(avatar, chat)
-        
         # Content area
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         content_box.set_hexpand(True)
@@ -354,7 +605,6 @@ class MainWindow(Adw.ApplicationWindow):
         
         # Chat title
         title_label = Gtk.Label()
-        title_label.set_text(chat.display_title)
         title_label.set_halign(Gtk.Align.START)
         title_label.set_hexpand(True)
         title_label.set_ellipsize(3)  # ELLIPSIZE_END
@@ -362,47 +612,83 @@ class MainWindow(Adw.ApplicationWindow):
         title_row.append(title_label)
         
         # Timestamp
-        if chat.last_message_date:
-            time_label = Gtk.Label()
-            time_str = self.format_message_time(chat.last_message_datetime)
-            time_label.set_text(time_str)
-            time_label.add_css_class("dim-label")
-            time_label.add_css_class("caption")
-            title_row.append(time_label)
+        time_label = Gtk.Label()
+        time_label.add_css_class("dim-label")
+        time_label.add_css_class("caption")
+        title_row.append(time_label)
         
         content_box.append(title_row)
         
         # Last message preview
-        if chat.last_message_text:
-            preview_label = Gtk.Label()
-            preview_text = chat.last_message_text
-            if len(preview_text) > 60:
-                preview_text = preview_text[:60] + "..."
-            
-            # Add sender info for group chats
-            if chat.is_group_chat and chat.last_message_address and not chat.last_message_from_me:
-                sender = chat.last_message_address.split('@')[0]  # Simple name extraction
-                preview_text = f"{sender}: {preview_text}"
-            elif chat.last_message_from_me:
-                preview_text = f"You: {preview_text}"
-            
-            preview_label.set_text(preview_text)
-            preview_label.set_halign(Gtk.Align.START)
-            preview_label.set_ellipsize(3)  # ELLIPSIZE_END
-            preview_label.add_css_class("dim-label")
-            content_box.append(preview_label)
+        preview_label = Gtk.Label()
+        preview_label.set_halign(Gtk.Align.START)
+        preview_label.set_ellipsize(3)  # ELLIPSIZE_END
+        preview_label.set_max_width_chars(60)
+        preview_label.add_css_class("dim-label")
+        content_box.append(preview_label)
         
         main_box.append(content_box)
-        row.set_child(main_box)
         
-        return row
+        # Store references so bind_chat_row only has to set values
+        main_box.avatar = avatar
+        main_box.title_label = title_label
+        main_box.time_label = time_label
+        main_box.preview_label = preview_label
+        
+        return main_box
+    
+    def bind_chat_row(self, row: Gtk.Widget, chat: ChatRecord):
+        """Show a chat's data in a (possibly recycled) chat list row."""
+        row.chat = chat
+        
+        # Avatar placeholder until the real one is loaded asynchronously
+        avatar = row.avatar
+        avatar.chat_guid = chat.guid
+        if chat.is_group_chat:
+            avatar.set_from_icon_name("group-symbolic")
+        else:
+            avatar.set_from_icon_name("person-symbolic")
+        # Fill avatars in after the list has been painted
+        GLib.idle_add(self.load_chat_avatar_idle, avatar, chat, priority=GLib.PRIORITY_LOW)
+        
+        row.title_label.set_text(chat.display_title)
+        
+        # Timestamp
+        if chat.last_message_date:
+            row.time_label.set_text(
+                self.format_message_time(chat.last_message_datetime, self.get_batch_now())
+            )
+            row.time_label.set_visible(True)
+        else:
+            row.time_label.set_visible(False)
+        
+        # Last message preview
+        if chat.last_message_text:
+            # Pango ellipsizes long previews, so the text is not sliced here.
+            # The prefix adds "You: " or the group sender's name.
+            row.preview_label.set_text(f"{chat.preview_prefix}{chat.last_message_text}")
+            row.preview_label.set_visible(True)
+        else:
+            row.preview_label.set_visible(False)
+    
+    def get_batch_now(self) -> datetime:
+        """Get a current time shared by all rows bound in this main loop iteration."""
+        if self._batch_now is None:
+            self._batch_now = datetime.now()
+            GLib.idle_add(self.clear_batch_now)
+        return self._batch_now
     
-    def format_message_time(self, dt: datetime) -> str:
+    def clear_batch_now(self):
+        """Drop the shared current time once the batch of row binds is done."""
+        self._batch_now = None
+        return False  # Remove from idle queue
+    
+    def format_message_time(self, dt: datetime, now: datetime = None) -> str:
         """Format message timestamp for display."""
         if not dt:
             return ""
         
-        now = datetime.now()
+        now = now or datetime.now()
         diff = now - dt
         
         if diff.days == 0:
@@ -420,25 +706,19 @@ class MainWindow(Adw.ApplicationWindow):
     
     def get_message_receipt_status(self, message):
         """Get the read receipt status for a message. Returns (status_text, css_class)."""
-        if not message.is_from_me:
-            return "", ""  # Only show receipts for sent messages
-        
-        if message.date_read:
-            # Message has been read - use double checkmark
-            return "✓✓ Read", "read"
-        elif message.date_delivered:
-            # Message has been delivered but not read - use single checkmark
-            return "✓ Delivered", "delivered"
-        else:
-            # Message is still sending or failed - use clock icon
-            return "🕒 Sending...", "sending"
+        return _RECEIPT_TABLE[message.receipt_state]
     
-    def on_chat_selected(self, list_box, row):
+    def on_chat_selected(self, selection, pspec):
         """Handle chat selection."""
-        if row is None:
+        item = selection.get_selected_item()
+        if item is None or self._restoring_selection:
             return
         
-        chat = getattr(row, 'chat', None)
+        chat = item.chat
+        if chat and self.current_chat and chat.guid == self.current_chat.guid:
+            # The open chat's row only moved; its view is already loaded
+            self.current_chat = chat
+            return
         if chat:
             self.current_chat = chat
             self.load_chat_view(chat)
@@ -450,9 +730,10 @@ class MainWindow(Adw.ApplicationWindow):
         chat_view_name = f"chat_{chat.guid}"
         
         # Check if chat view already exists
-        existing_view = self.content_stack.get_child_by_name(chat_view_name)
+        existing_view = self._chat_view_lru.get(chat.guid)
         if existing_view:
             # print(f"🎯 Chat view already exists, switching to: {chat_view_name}")
+            self._chat_view_lru.move_to_end(chat.guid)
             self.content_stack.set_visible_child_name(chat_view_name)
             return
         
@@ -488,10 +769,7 @@ class MainWindow(Adw.ApplicationWindow):
         messages_box.set_margin_end(12)
         messages_box.set_margin_top(12)
         messages_box.set_margin_bottom(12)
-        
-        # Store references for auto-scrolling
-        chat_view.messages_area = messages_area
-        chat_view.messages_box = messages_box
+        self.add_message_gestures(messages_box)
         
         # Load recent messages
         self.load_chat_messages(chat, messages_box, messages_area)
@@ -532,62 +810,79 @@ class MainWindow(Adw.ApplicationWindow):
         send_button.connect("clicked", self.on_send_message)
         input_area.append(send_button)
         
-        # Store references for later use
-        input_area.message_entry = message_entry
-        input_area.send_button = send_button
-        input_area.attachment_button = attachment_button
-        chat_view.input_area = input_area
+        # Store references for later use and auto-scrolling
+        chat_view.handles = ChatViewHandles(
+            messages_box=messages_box,
+            messages_area=messages_area,
+            message_entry=message_entry
+        )
         
         input_container.append(input_area)
         chat_view.append(input_container)
         
         # Add to stack
-        self.content_stack.add_named(chat_view, f"chat_{chat.guid}")
-        self.content_stack.set_visible_child_name(f"chat_{chat.guid}")
+        self.content_stack.add_named(chat_view, chat_view_name)
+        self.content_stack.set_visible_child_name(chat_view_name)
+        self._chat_view_lru[chat.guid] = chat_view
+        
+        # Drop the least recently opened views beyond the cache size
+        while len(self._chat_view_lru) > self.CHAT_VIEW_CACHE_SIZE:
+            _, old_view = self._chat_view_lru.popitem(last=False)
+            self.evict_chat_view(old_view)
+    
+    def evict_chat_view(self, chat_view: Gtk.Widget):
+        """Remove a cached chat view from the stack and release its messages."""
+        self.get_message_index(chat_view.handles.messages_box).clear()
+        self.content_stack.remove(chat_view)
     
     def load_chat_messages(self, chat: ChatRecord, messages_box: Gtk.Box, messages_area: Gtk.ScrolledWindow = None):
         """Load messages for a chat."""
+        # Show a placeholder right away; the cache is read off the UI thread
+        loading_label = Gtk.Label()
+        loading_label.set_text("Loading messages...")
+        loading_label.add_css_class("dim-label")
+        messages_box.append(loading_label)
+        
+        def show_error(error):
+            # Remove loading label
+            if loading_label.get_parent() is messages_box:
+                messages_box.remove(loading_label)
+            error_label = Gtk.Label()
+            error_label.set_text(f"Failed to load messages: {str(error)}")
+            error_label.add_css_class("error")
+            messages_box.append(error_label)
+        
+        config = self.get_server_config()
+        self._submit(
+            self.load_messages_async(
+                config['url'], config['password'], chat.guid, messages_box, messages_area
+            ),
+            on_error=show_error
+        )
+    
+    async def load_messages_async(self, server_url: str, password: str,
+                                  chat_guid: str, messages_box: Gtk.Box, messages_area: Gtk.ScrolledWindow = None):
+        """Load messages from the cache, falling back to the server."""
         # Get cached messages first
-        messages = self.chat_service.get_cached_chat_messages(chat.guid, limit=50)
-        
-        if not messages:
-            # No cached messages, show loading and fetch from server
-            loading_label = Gtk.Label()
-            loading_label.set_text("Loading messages...")
-            loading_label.add_css_class("dim-label")
-            messages_box.append(loading_label)
-            
-            # Load from server in background
-            config = self.get_application().config_manager.get_server_config()
-            if config['url'] and config['password']:
-                def run_async():
-                    try:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        loop.run_until_complete(
-                            self.load_messages_from_server_async(
-                                config['url'], config['password'], chat.guid, messages_box, messages_area
-                            )
-                        )
-                        loop.close()
-                    except Exception as e:
-                        def show_error():
-                            # Remove loading label
-                            messages_box.remove(loading_label)
-                            error_label = Gtk.Label()
-                            error_label.set_text(f"Failed to load messages: {str(e)}")
-                            error_label.add_css_class("error")
-                            messages_box.append(error_label)
-                        GLib.idle_add(show_error)
-                
-                thread = threading.Thread(target=run_async, daemon=True)
-                thread.start()
-        else:
-            # Display cached messages
-            self.display_messages(messages, messages_box)
+        messages = self.chat_service.get_cached_chat_messages(chat_guid, limit=50)
+        
+        if not messages and server_url and password:
+            # No cached messages, fetch from server
+            await self.load_messages_from_server_async(
+                server_url, password, chat_guid, messages_box, messages_area
+            )
+            return
+        
+        prepared_messages = self.prepare_messages(messages)
+        
+        def update_ui():
+            # Display cached messages (this also clears the loading message)
+            self.display_messages_prepared(prepared_messages, messages_box)
             # Auto-scroll to bottom after displaying messages
             if messages_area:
                 GLib.idle_add(self.scroll_to_bottom, messages_area)
+        
+        self._post_ui(update_ui)
     
     async def load_messages_from_server_async(self, server_url: str, password: str, 
                                             chat_guid: str, messages_box: Gtk.Box, messages_area: Gtk.ScrolledWindow = None):
@@ -596,36 +891,30 @@ class MainWindow(Adw.ApplicationWindow):
             messages = await self.chat_service.sync_chat_messages(
                 server_url, password, chat_guid, limit=50
             )
+            # Filter and sort here on the worker thread so the UI only appends
+            prepared_messages = self.prepare_messages(messages)
             
             def update_ui():
-                # Clear loading message
-                child = messages_box.get_first_child()
-                if child:
-                    messages_box.remove(child)
-                
-                # Display messages
-                self.display_messages(messages, messages_box)
+                # Display messages (this also clears the loading message)
+                self.display_messages_prepared(prepared_messages, messages_box)
                 # Auto-scroll to bottom after loading from server
                 if messages_area:
                     GLib.idle_add(self.scroll_to_bottom, messages_area)
             
-            GLib.idle_add(update_ui)
+            self._post_ui(update_ui)
             
         except Exception as e:
+            error = str(e)
             def show_error():
                 # Remove any existing children
-                while True:
-                    child = messages_box.get_first_child()
-                    if child is None:
-                        break
-                    messages_box.remove(child)
+                self.clear_messages_box(messages_box)
                 
                 error_label = Gtk.Label()
-                error_label.set_text(f"Failed to load messages: {str(e)}")
+                error_label.set_text(f"Failed to load messages: {error}")
                 error_label.add_css_class("error")
                 messages_box.append(error_label)
             
-            GLib.idle_add(show_error)
+            self._post_ui(show_error)
     
     def scroll_to_bottom(self, scrolled_window: Gtk.ScrolledWindow):
         """Scroll to the bottom of a scrolled window."""
@@ -636,35 +925,98 @@ class MainWindow(Adw.ApplicationWindow):
         except Exception as e:
             pass  # Silently handle scroll errors
     
+    def get_message_index(self, messages_box: Gtk.Box) -> dict:
+        """Get the message GUID -> widget lookup for a messages box."""
+        index = getattr(messages_box, 'message_index', None)
+        if index is None:
+            index = {}
+            messages_box.message_index = index
+        return index
+    
+    def prepare_messages(self, messages) -> list:
+        """Filter messages for display; safe to call off the UI thread.
+        
+        messages must already be oldest first, as DatabaseManager.get_chat_messages
+        returns them, so no sort is needed here.
+        """
+        # Filter out reaction events; these are represented as badges on the parent message.
+        # Reaction events (tapbacks) carry both an associated GUID and type
+        return [
+            m for m in messages if not (m.associated_message_guid and m.associated_message_type)
+        ]
+    
+    def clear_messages_box(self, messages_box: Gtk.Box):
+        """Remove every child of a messages box with a single relayout."""
+        # Hidden widgets are not re-measured, so removals don't each queue a resize
+        messages_box.set_visible(False)
+        child = messages_box.get_first_child()
+        while child:
+            next_child = child.get_next_sibling()
+            messages_box.remove(child)
+            child = next_child
+        self.get_message_index(messages_box).clear()
+        messages_box.set_visible(True)
+    
+    def trim_message_widgets(self, messages_box: Gtk.Box):
+        """Drop the oldest message widgets once a box holds more than the cap."""
+        index = self.get_message_index(messages_box)
+        child = messages_box.get_first_child()
+        while child and len(index) > self.MAX_MESSAGE_WIDGETS:
+            next_child = child.get_next_sibling()
+            guid = getattr(child, 'message_guid', None)
+            if guid is not None:
+                messages_box.remove(child)
+                index.pop(guid, None)
+            child = next_child
+    
     def display_messages(self, messages, messages_box: Gtk.Box):
         """Display messages in the messages box."""
-        # Clear existing messages
-        while True:
-            child = messages_box.get_first_child()
-            if child is None:
-                break
-            messages_box.remove(child)
+        self.display_messages_prepared(self.prepare_messages(messages), messages_box)
+    
+    def display_messages_prepared(self, sorted_messages, messages_box: Gtk.Box):
+        """Display already filtered and sorted messages, reusing widgets already shown."""
+        index = self.get_message_index(messages_box)
+        wanted_guids = {m.guid for m in sorted_messages}
 
-        # Filter out reaction events; these are represented as badges on the parent message.
-        filtered_messages = [m for m in messages if not self.is_reaction_event(m)]
+        # Drop placeholder labels and messages that are no longer in the list
+        child = messages_box.get_first_child()
+        while child:
+            next_child = child.get_next_sibling()
+            guid = getattr(child, 'message_guid', None)
+            if guid not in wanted_guids:
+                messages_box.remove(child)
+                index.pop(guid, None)
+            child = next_child
 
-        if not filtered_messages:
+        if not sorted_messages:
             no_messages_label = Gtk.Label()
             no_messages_label.set_text("No messages in this chat")
             no_messages_label.add_css_class("dim-label")
             messages_box.append(no_messages_label)
             return
 
-        # Sort messages by date (newest last for natural reading order)
-        sorted_messages = sorted(filtered_messages, key=lambda m: m.date_created)
-
+        # Only create widgets for messages not already shown, keeping date order;
+        # bound methods are looked up once for the loop
+        now = datetime.now()
+        previous = None
+        get_widget = index.get
+        create_widget = self.create_message_widget
+        insert_after = messages_box.insert_child_after
         for message in sorted_messages:
-            message_widget = self.create_message_widget(message)
-            # Store the message GUID for future reference
-            message_widget.message_guid = message.guid
-            messages_box.append(message_widget)
+            message_widget = get_widget(message.guid)
+            if message_widget is None:
+                message_widget = create_widget(message, now)
+                # Store the message GUID for future reference
+                message_widget.message_guid = message.guid
+                index[message.guid] = message_widget
+                insert_after(message_widget, previous)
+            elif message_widget.get_prev_sibling() is not previous:
+                messages_box.reorder_child_after(message_widget, previous)
+            previous = message_widget
+        
+        self.trim_message_widgets(messages_box)
     
-    def create_message_widget(self, message) -> Gtk.Widget:
+    def create_message_widget(self, message, now: datetime = None) -> Gtk.Widget:
         """Create a widget for a message with reaction and context menu support."""
         # Main container
         message_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
@@ -694,18 +1046,9 @@ class MainWindow(Adw.ApplicationWindow):
         else:
             bubble_event_box.add_css_class("message-bubble-received")
         
-        # Add gesture controllers for reactions and context menu
-        # Long press gesture for reactions (mobile-style)
-        long_press = Gtk.GestureLongPress()
-        long_press.set_delay_factor(1.0)  # Standard delay
-        long_press.connect("pressed", self.on_message_long_press, message)
-        bubble_event_box.add_controller(long_press)
-        
-        # Right-click gesture for context menu
-        right_click = Gtk.GestureClick()
-        right_click.set_button(3)  # Right mouse button
-        right_click.connect("pressed", self.on_message_right_click, message)
-        bubble_event_box.add_controller(right_click)
+        # Reactions and the context menu are handled by the gestures on the
+        # messages box, which find the bubble through this attribute
+        bubble_event_box.message = message
         
         # Message text
         if message.text:
@@ -719,21 +1062,22 @@ class MainWindow(Adw.ApplicationWindow):
             bubble_event_box.append(text_label)
         
         # Attachments
-        if hasattr(message, 'attachments') and message.attachments:
-            print(f"DEBUG: Message has {len(message.attachments)} attachments")
+        # MessageRecord always has a list here (empty when there are none)
+        attachments = message.attachments
+        if attachments:
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Message has %d attachments", len(attachments))
             attachment_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
             attachment_box.set_margin_top(4)
             
-            for attachment in message.attachments:
-                print(f"DEBUG: Processing attachment: {attachment}")
+            for attachment in attachments:
+                if debug:
+                    logger.debug("Processing attachment: %s", attachment)
                 attachment_widget = self.create_attachment_widget(attachment)
                 attachment_box.append(attachment_widget)
             
             bubble_event_box.append(attachment_box)
-        else:
-            # Check the actual value of attachments
-            if hasattr(message, 'attachments'):
-                print(f"DEBUG: Message attachments value: {message.attachments} (type: {type(message.attachments)})")
         
         # Timestamp and sender info
         info_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
@@ -749,14 +1093,14 @@ class MainWindow(Adw.ApplicationWindow):
         
         # Timestamp
         time_label = Gtk.Label()
-        time_str = self.format_message_time(message.datetime_created)
+        time_str = self.format_message_time(message.datetime_created, now)
         time_label.set_text(time_str)
         time_label.add_css_class("caption")
         time_label.add_css_class("dim-label")
         info_box.append(time_label)
         
         # Read receipt indicators (only for sent messages)
-        if message.is_from_me:
+        if message.receipt_state:
             receipt_label = Gtk.Label()
             receipt_status, receipt_class = self.get_message_receipt_status(message)
             if receipt_status:
@@ -769,7 +1113,7 @@ class MainWindow(Adw.ApplicationWindow):
                 info_box.append(receipt_label)
         
         # Edit indicator
-        if hasattr(message, 'is_edited') and message.is_edited:
+        if message.is_edited:
             edit_label = Gtk.Label()
             edit_label.set_text("(edited)")
             edit_label.add_css_class("caption")
@@ -780,23 +1124,13 @@ class MainWindow(Adw.ApplicationWindow):
         content_row.append(bubble_event_box)
         message_box.append(content_row)
         
-        # Get and display reactions
-        reactions = self.chat_service.get_message_reactions(message.guid)
-        if reactions:
-            reactions_widget = self.create_reactions_widget(reactions, message.is_from_me)
-        else:
-            # Keep a placeholder to simplify later updates
-            reactions_widget = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
-            if message.is_from_me:
-                reactions_widget.set_halign(Gtk.Align.END)
-            else:
-                reactions_widget.set_halign(Gtk.Align.START)
-        # Store a reference so we can update badges later without rebuilding the whole message
-        message_box.reactions_widget = reactions_widget
-        message_box.append(reactions_widget)
-        
-        # Store message reference for gesture callbacks
-        bubble_event_box.message = message
+        # Get and display reactions; messages without any get no widget
+        # until update_message_reactions() sees the first one
+        message_box.reactions_widget = None
+        message_box.reactions_signature = None
+        # Reactions line up with the bubble; fixed for the widget's lifetime
+        message_box.reactions_halign = Gtk.Align.END if message.is_from_me else Gtk.Align.START
+        self.update_message_reactions(message_box, message)
         
         return message_box
     
@@ -809,27 +1143,17 @@ class MainWindow(Adw.ApplicationWindow):
         # Get file info from metadata or original name
         file_name = attachment.get('original_roi') or attachment.get('transfer_name', 'Unknown File')
         file_size = attachment.get('total_bytes', 0)
-        mime_type = attachment.get('mime_type', '')
+        mime_type = attachment.get('mime_type') or ''
         
         # Icon based on file type
         icon_widget = Gtk.Image()
         icon_widget.set_pixel_size(32)
         
-        if mime_type.startswith('image/'):
-            icon_widget.set_from_icon_name("image-x-generic")
-            attachment_container.add_css_class("attachment-image")
-        elif mime_type.startswith('video/'):
-            icon_widget.set_from_icon_name("video-x-generic")
-            attachment_container.add_css_class("attachment-video")
-        elif mime_type.startswith('audio/'):
-            icon_widget.set_from_icon_name("audio-x-generic")
-            attachment_container.add_css_class("attachment-audio")
-        elif 'pdf' in mime_type:
-            icon_widget.set_from_icon_name("application-pdf")
-            attachment_container.add_css_class("attachment-document")
-        else:
-            icon_widget.set_from_icon_name("text-x-generic")
-            attachment_container.add_css_class("attachment-document")
+        icon_name, css_class = _MIME_CATEGORY_ICONS.get(mime_type.partition('/')[0]) or (
+            _MIME_PDF_ICON if 'pdf' in mime_type else _MIME_DEFAULT_ICON
+        )
+        icon_widget.set_from_icon_name(icon_name)
+        attachment_container.add_css_class(css_class)
         
         attachment_container.append(icon_widget)
         
@@ -871,32 +1195,36 @@ class MainWindow(Adw.ApplicationWindow):
         
         return attachment_container
     
-    def format_file_size(self, bytes_size: int) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def format_file_size(bytes_size: int) -> str:
         """Format file size in human readable format."""
-        if bytes_size < 1024:
+        unit = (bytes_size.bit_length() - 1) // 10
+        if unit <= 0:
             return f"{bytes_size} B"
-        elif bytes_size < 1024 * 1024:
-            return f"{bytes_size / 1024:.1f} KB"
-        elif bytes_size < 1024 * 1024 * 1024:
-            return f"{bytes_size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{bytes_size / (1024 * 1024 * 1024):.1f} GB"
+        divisor, suffix = _SIZE_UNITS[min(unit, len(_SIZE_UNITS) - 1)]
+        return f"{bytes_size / divisor:.1f} {suffix}"
     
     def on_download_attachment(self, button, attachment):
         """Handle attachment download button click."""
-        # Run download in background to avoid blocking UI
-        def download_async():
-            try:
-                file_path = self.chat_service.get_attachment(attachment['guid'])
-                if file_path and os.path.exists(file_path):
-                    # Open file manager to show the downloaded file
-                    GLib.idle_add(self.show_download_complete, file_path)
-                else:
-                    GLib.idle_add(self.show_error_toast, "Failed to download attachment")
-            except Exception as e:
-                GLib.idle_add(self.show_error_toast, f"Download error: {str(e)}")
+        config = self.get_server_config()
+        if not config['url'] or not config['password']:
+            self.show_error_toast("No server configuration found")
+            return
         
-        threading.Thread(target=download_async, daemon=True).start()
+        def download_done(file_path):
+            if file_path and os.path.exists(file_path):
+                # Open file manager to show the downloaded file
+                self.show_download_complete(file_path)
+            else:
+                self.show_error_toast("Failed to download attachment")
+        
+        # Run download on the shared loop to avoid blocking UI
+        self._submit(
+            self.chat_service.get_attachment_path(config['url'], config['password'], attachment['guid']),
+            on_done=download_done,
+            on_error=lambda e: self.show_error_toast(f"Download error: {str(e)}")
+        )
     
     def show_download_complete(self, file_path: str):
         """Show a toast notification when download completes."""
@@ -916,7 +1244,46 @@ class MainWindow(Adw.ApplicationWindow):
         if hasattr(self, 'toast_overlay'):
             self.toast_overlay.add_toast(toast)
     
-    def create_reactions_widget(self, reactions, message_is_from_me) -> Gtk.Widget:
+    def update_message_reactions(self, message_box: Gtk.Box, message: MessageRecord, reactions=None):
+        """Rebuild a message's reaction badges, adding or dropping the widget as needed.
+        
+        reactions may be passed in when they were already fetched in bulk.
+        """
+        if reactions is None:
+            reactions = self.chat_service.get_message_reactions(message.guid)
+        
+        # Nothing to do when the same reactions as last time came back
+        signature = tuple(sorted(
+            (r.handle_address or "", r.associated_message_type or "") for r in reactions
+        )) or None
+        if signature == message_box.reactions_signature:
+            return
+        message_box.reactions_signature = signature
+        
+        reaction_counts = self.count_reactions(reactions)
+        reactions_widget = message_box.reactions_widget
+        
+        if not reaction_counts:
+            if reactions_widget is not None:
+                message_box.remove(reactions_widget)
+                message_box.reactions_widget = None
+        elif reactions_widget is not None:
+            # Only touch the badges whose counts changed
+            self.update_reactions_widget(reactions_widget, reaction_counts)
+        else:
+            # Store a reference so we can update badges later without rebuilding the whole message
+            reactions_widget = self.create_reactions_widget(reaction_counts, message_box.reactions_halign)
+            message_box.reactions_widget = reactions_widget
+            message_box.append(reactions_widget)
+    
+    def count_reactions(self, reactions) -> Counter:
+        """Group reactions by emoji and count them."""
+        get_emoji = self.get_reaction_emoji
+        return Counter(
+            emoji for emoji in (get_emoji(r.associated_message_type) for r in reactions) if emoji
+        )
+    
+    def create_reactions_widget(self, reaction_counts: Counter, halign: Gtk.Align) -> Gtk.Widget:
         """Create a widget to display reaction emojis."""
         reactions_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
         reactions_box.set_margin_start(16)
@@ -925,158 +1292,126 @@ class MainWindow(Adw.ApplicationWindow):
         reactions_box.set_margin_bottom(2)
         
         # Align reactions to match message alignment
-        if message_is_from_me:
-            reactions_box.set_halign(Gtk.Align.END)
-        else:
-            reactions_box.set_halign(Gtk.Align.START)
-        
-        # Group reactions by type and count them
-        reaction_counts = {}
-        for reaction in reactions:
-            emoji = self.get_reaction_emoji(reaction.associated_message_type)
-            if emoji:
-                if emoji in reaction_counts:
-                    reaction_counts[emoji] += 1
-                else:
-                    reaction_counts[emoji] = 1
+        reactions_box.set_halign(halign)
         
         # Create emoji labels for each reaction type
+        reactions_box.reaction_counts = {}
+        reactions_box.reaction_labels = {}
+        self.update_reactions_widget(reactions_box, reaction_counts)
+        
+        return reactions_box
+    
+    def update_reactions_widget(self, reactions_box: Gtk.Box, reaction_counts: Counter):
+        """Bring a reactions widget up to date, changing only the badges that differ."""
+        old_counts = reactions_box.reaction_counts
+        labels = reactions_box.reaction_labels
+        
+        # Drop badges for reactions that are gone
+        for emoji in old_counts.keys() - reaction_counts.keys():
+            reactions_box.remove(labels.pop(emoji))
+        
         for emoji, count in reaction_counts.items():
-            reaction_label = Gtk.Label()
+            if old_counts.get(emoji) == count:
+                continue
+            
+            reaction_label = labels.get(emoji)
+            if reaction_label is None:
+                reaction_label = Gtk.Label()
+                reaction_label.add_css_class("reaction-emoji")
+                reaction_label.set_margin_start(2)
+                reaction_label.set_margin_end(2)
+                reactions_box.append(reaction_label)
+                labels[emoji] = reaction_label
+            
             if count > 1:
                 reaction_label.set_text(f"{emoji} {count}")
             else:
                 reaction_label.set_text(emoji)
-            
-            reaction_label.add_css_class("reaction-emoji")
-            reaction_label.set_margin_start(2)
-            reaction_label.set_margin_end(2)
-            reactions_box.append(reaction_label)
         
-        return reactions_box
+        reactions_box.reaction_counts = dict(reaction_counts)
     
-    def get_reaction_emoji(self, reaction_type: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def get_reaction_emoji(reaction_type: str) -> str:
         """Convert a reaction type to its corresponding emoji."""
-        # Map BlueBubbles reaction types to emojis
-        reaction_map = {
-            "2000": "❤️",  # love
-            "2001": "👍",  # like  
-            "2002": "👎",  # dislike
-            "2003": "😂",  # laugh
-            "2004": "‼️",  # emphasis
-            "2005": "❓",  # question
-            # Alternative mappings based on common reaction names
-            "love": "❤️",
-            "like": "👍", 
-            "dislike": "👎",
-            "laugh": "😂",
-            "emphasis": "‼️",
-            "question": "❓"
-        }
-        
         if reaction_type:
-            return reaction_map.get(reaction_type, "👍")  # Default to thumbs up
+            return _REACTION_EMOJI.get(reaction_type, "👍")  # Default to thumbs up
         return ""
 
-    def is_reaction_event(self, message) -> bool:
-        """Return True if this message is a reaction event (tapback), not a normal chat message."""
-        try:
-            return bool(message.associated_message_guid and message.associated_message_type)
-        except Exception:
-            return False
-    
     def load_server_info(self):
         """Load server information and display in title."""
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if config['url'] and config['password']:
-            # Run the async function in a thread to avoid event loop issues
-            def run_async():
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    loop.run_until_complete(self.load_server_info_async(config['url'], config['password']))
-                    loop.close()
-                except Exception as e:
-                    def show_error():
-                        self.show_toast(f"Failed to load server info: {str(e)}")
-                    GLib.idle_add(show_error)
-            
-            thread = threading.Thread(target=run_async, daemon=True)
-            thread.start()
+            self._submit(
+                self.load_server_info_async(config['url'], config['password']),
+                on_error=lambda e: self.show_toast(f"Failed to load server info: {str(e)}")
+            )
     
     def show_about_dialog(self):
         """Show the About BlueBubbles dialog with server and iMessage info."""
-        # Run the async function in a thread to get the data
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.show_about_dialog_async())
-                loop.close()
-            except Exception as e:
-                error_msg = str(e)
-                def show_error():
-                    self.show_toast(f"Failed to load server information: {error_msg}")
-                GLib.idle_add(show_error)
-        
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
-    
-    async def show_about_dialog_async(self):
-        """Load server information and show the about dialog."""
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
-            def show_error():
-                self.show_toast("No server configuration found")
-            GLib.idle_add(show_error)
+            self.show_toast("No server configuration found")
             return
         
-        try:
-            api_method = self.get_application().config_manager.get_api_method()
-            async with BlueBubblesClient(config['url'], config['password'], api_method) as client:
-                # Fetch all the information
-                server_info = await client.get_server_info()
-                try:
-                    icloud_info = await client.get_icloud_account_info()
-                except BlueBubblesAPIError:
-                    icloud_info = None  # iCloud info might not be available
-                
-                try:
-                    statistics = await client.get_server_statistics()
-                except BlueBubblesAPIError:
-                    statistics = None  # Statistics might not be available
-                
-                def show_dialog():
-                    self.create_about_dialog(server_info, icloud_info, statistics)
-                
-                GLib.idle_add(show_dialog)
+        # Fire and forget: the dialog is built once the fetch completes
+        self._submit(
+            self.fetch_about_info(config['url'], config['password']),
+            on_done=self.create_about_dialog,
+            on_error=lambda e: self.show_toast(f"Failed to load server information: {str(e)}")
+        )
+    
+    async def fetch_about_info(self, server_url: str, password: str) -> str:
+        """Fetch the server info, iCloud account info and statistics as about dialog text."""
+        async with self.chat_service.client(server_url, password) as client:
+            # Fetch all the information; the requests are independent,
+            # so run them concurrently
+            server_info, icloud_info, statistics = await asyncio.gather(
+                client.get_server_info(),
+                client.get_icloud_account_info(),
+                client.get_server_statistics(),
+                return_exceptions=True
+            )
         
-        except Exception as e:
-            error_msg = str(e)
-            def show_error():
-                self.show_toast(f"Failed to load server information: {error_msg}")
-            GLib.idle_add(show_error)
+        if isinstance(server_info, BaseException):
+            raise server_info
+        
+        # iCloud info and statistics might not be available
+        if isinstance(icloud_info, BlueBubblesAPIError):
+            icloud_info = None
+        elif isinstance(icloud_info, BaseException):
+            raise icloud_info
+        
+        if isinstance(statistics, BlueBubblesAPIError):
+            statistics = None
+        elif isinstance(statistics, BaseException):
+            raise statistics
+        
+        # Format on the loop thread so the main thread only builds the dialog
+        return self.format_about_body(server_info, icloud_info, statistics)
     
     # New callback methods for the enhanced features
     
     def on_attachment_clicked(self, button):
         """Handle attachment button click to show file picker."""
-        file_dialog = Gtk.FileDialog()
-        file_dialog.set_title("Select Image")
-        
-        # Set up image filters
-        filter_images = Gtk.FileFilter()
-        filter_images.set_name("Images")
-        filter_images.add_mime_type("image/jpeg")
-        filter_images.add_mime_type("image/png")
-        filter_images.add_mime_type("image/gif")
-        filter_images.add_mime_type("image/webp")
-        filter_images.add_mime_type("image/heic")
-        
-        filter_list = Gio.ListStore.new(Gtk.FileFilter)
-        filter_list.append(filter_images)
-        file_dialog.set_filters(filter_list)
-        file_dialog.set_default_filter(filter_images)
+        # The dialog keeps no state between picks, so build it once
+        if self._image_file_dialog is None:
+            file_dialog = Gtk.FileDialog()
+            file_dialog.set_title("Select Image")
+            
+            # Set up image filters
+            filter_images = Gtk.FileFilter()
+            filter_images.set_name("Images")
+            for mime_type in self.IMAGE_MIME_TYPES:
+                filter_images.add_mime_type(mime_type)
+            
+            filter_list = Gio.ListStore.new(Gtk.FileFilter)
+            filter_list.append(filter_images)
+            file_dialog.set_filters(filter_list)
+            file_dialog.set_default_filter(filter_images)
+            self._image_file_dialog = file_dialog
+        
+        file_dialog = self._image_file_dialog
         
         def on_file_selected(dialog, result):
             try:
@@ -1102,19 +1437,22 @@ class MainWindow(Adw.ApplicationWindow):
             self.is_typing = True
             self.send_typing_indicator_async(True)
         
-        # Reset the typing timeout
-        if self.typing_timeout_id:
-            GLib.source_remove(self.typing_timeout_id)
-        
-        def stop_typing():
-            if self.is_typing:
-                self.is_typing = False
-                self.send_typing_indicator_async(False)
-            self.typing_timeout_id = None
-            return False
+        # Push back the deadline; a single ticking source checks it, so
+        # keystrokes don't create and destroy a GLib timeout each time
+        self._typing_deadline = time.monotonic() + self.TYPING_TIMEOUT
+        if self.is_typing and not self._typing_tick_id:
+            self._typing_tick_id = GLib.timeout_add(500, self.on_typing_tick)
+    
+    def on_typing_tick(self):
+        """Stop the typing indicator once the entry has been idle long enough."""
+        if self.is_typing and time.monotonic() < self._typing_deadline:
+            return True  # Keep ticking
         
-        # Stop typing after 3 seconds of inactivity
-        self.typing_timeout_id = GLib.timeout_add(3000, stop_typing)
+        if self.is_typing:
+            self.is_typing = False
+            self.send_typing_indicator_async(False)
+        self._typing_tick_id = 0
+        return False
     
     def on_send_message(self, widget):
         """Handle send message button click or entry activation."""
@@ -1122,14 +1460,12 @@ class MainWindow(Adw.ApplicationWindow):
         if not current_page or not self.current_chat:
             return
         
-        input_area = getattr(current_page, 'input_area', None)
-        if not input_area:
-            return
-        
-        message_entry = getattr(input_area, 'message_entry', None)
-        if not message_entry:
+        # The placeholder page has no chat view handles
+        handles = getattr(current_page, 'handles', None)
+        if handles is None:
             return
         
+        message_entry = handles.message_entry
         message_text = message_entry.get_text().strip()
         if not message_text:
             return
@@ -1145,125 +1481,171 @@ class MainWindow(Adw.ApplicationWindow):
         # Send the message
         self.send_message_async(message_text)
     
-    def on_message_long_press(self, gesture, x, y, message):
+    def add_message_gestures(self, messages_box: Gtk.Box):
+        """Add one set of reaction/context menu gestures shared by all bubbles in a box."""
+        # Long press gesture for reactions (mobile-style)
+        long_press = Gtk.GestureLongPress()
+        long_press.set_delay_factor(1.0)  # Standard delay
+        long_press.connect("pressed", self.on_message_long_press)
+        messages_box.add_controller(long_press)
+        
+        # Right-click gesture for context menu
+        right_click = Gtk.GestureClick()
+        right_click.set_button(3)  # Right mouse button
+        right_click.connect("pressed", self.on_message_right_click)
+        messages_box.add_controller(right_click)
+    
+    def find_message_bubble(self, messages_box: Gtk.Widget, x: float, y: float):
+        """Return the message bubble under a point in the messages box, if any."""
+        widget = messages_box.pick(x, y, Gtk.PickFlags.DEFAULT)
+        while widget is not None and widget is not messages_box:
+            if hasattr(widget, 'message'):
+                return widget
+            widget = widget.get_parent()
+        return None
+    
+    def on_message_long_press(self, gesture, x, y):
         """Handle long press on message for reactions."""
-        self.show_reaction_popover(gesture.get_widget(), message)
+        bubble = self.find_message_bubble(gesture.get_widget(), x, y)
+        if bubble is not None:
+            self.show_reaction_popover(bubble, bubble.message)
     
-    def on_message_right_click(self, gesture, n_press, x, y, message):
+    def on_message_right_click(self, gesture, n_press, x, y):
         """Handle right click on message for context menu."""
-        self.show_message_context_menu(gesture.get_widget(), message, x, y)
+        messages_box = gesture.get_widget()
+        bubble = self.find_message_bubble(messages_box, x, y)
+        if bubble is not None:
+            # The menu is positioned relative to the bubble
+            _, bubble_x, bubble_y = messages_box.translate_coordinates(bubble, x, y)
+            self.show_message_context_menu(bubble, bubble.message, bubble_x, bubble_y)
+    
+    def create_message_popover(self, child: Gtk.Widget) -> Gtk.Popover:
+        """Create a popover that is reused across messages and detaches when closed."""
+        popover = Gtk.Popover()
+        popover.set_position(Gtk.PositionType.TOP)
+        popover.set_child(child)
+        popover.message = None
+        # Detach from the bubble so it doesn't keep a (possibly evicted) bubble alive
+        popover.connect("closed", lambda p: p.unparent())
+        return popover
+    
+    def show_message_popover(self, popover: Gtk.Popover, widget, message):
+        """Attach a shared popover to a message bubble and show it."""
+        if popover.get_parent() is not None:
+            popover.unparent()
+        popover.set_parent(widget)
+        popover.message = message
+        popover.popup()
     
     def show_reaction_popover(self, widget, message):
         """Show reaction picker popover."""
-        popover = Gtk.Popover()
-        popover.set_parent(widget)
-        popover.set_position(Gtk.PositionType.TOP)
-        
-        # Reaction buttons container
-        reaction_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        reaction_box.set_margin_start(12)
-        reaction_box.set_margin_end(12)
-        reaction_box.set_margin_top(8)
-        reaction_box.set_margin_bottom(8)
-        
-        # Common reactions
-        reactions = [
-            ("❤️", "love"),
-            ("👍", "like"),
-            ("👎", "dislike"),
-            ("😂", "laugh"),
-            ("‼️", "emphasis"),
-            ("❓", "question")
-        ]
-        
-        for emoji, reaction_type in reactions:
-            button = Gtk.Button()
-            button.set_label(emoji)
-            button.add_css_class("flat")
-            button.connect("clicked", self.on_reaction_selected, message, reaction_type, popover)
-            reaction_box.append(button)
-        
-        # Remove reaction button if this is from me
-        if message.is_from_me:
+        if self._reaction_popover is None:
+            # Reaction buttons container
+            reaction_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+            reaction_box.set_margin_start(12)
+            reaction_box.set_margin_end(12)
+            reaction_box.set_margin_top(8)
+            reaction_box.set_margin_bottom(8)
+            
+            for emoji, reaction_type in _REACTIONS:
+                button = Gtk.Button()
+                button.set_label(emoji)
+                button.add_css_class("flat")
+                button.connect("clicked", self.on_reaction_selected, reaction_type)
+                reaction_box.append(button)
+            
+            # Remove reaction button, only shown for my messages
             separator = Gtk.Separator(orientation=Gtk.Orientation.VERTICAL)
             reaction_box.append(separator)
             
             remove_button = Gtk.Button()
             remove_button.set_label("Remove")
             remove_button.add_css_class("flat")
-            remove_button.connect("clicked", self.on_reaction_removed, message, popover)
+            remove_button.connect("clicked", self.on_reaction_removed)
             reaction_box.append(remove_button)
+            
+            self._reaction_popover = self.create_message_popover(reaction_box)
+            self._reaction_popover.remove_widgets = (separator, remove_button)
         
-        popover.set_child(reaction_box)
-        popover.popup()
+        popover = self._reaction_popover
+        for remove_widget in popover.remove_widgets:
+            remove_widget.set_visible(message.is_from_me)
+        self.show_message_popover(popover, widget, message)
     
     def show_message_context_menu(self, widget, message, x, y):
         """Show context menu for message operations."""
-        popover = Gtk.Popover()
-        popover.set_parent(widget)
-        popover.set_position(Gtk.PositionType.TOP)
-        
-        # Menu items container
-        menu_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        menu_box.set_margin_start(8)
-        menu_box.set_margin_end(8)
-        menu_box.set_margin_top(8)
-        menu_box.set_margin_bottom(8)
-        
-        # Copy text
-        if message.text:
+        if self._context_popover is None:
+            # Menu items container
+            menu_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+            menu_box.set_margin_start(8)
+            menu_box.set_margin_end(8)
+            menu_box.set_margin_top(8)
+            menu_box.set_margin_bottom(8)
+            
+            # Copy text
             copy_button = Gtk.Button()
             copy_button.set_label("Copy Text")
             copy_button.add_css_class("flat")
-            copy_button.connect("clicked", self.on_copy_message, message, popover)
+            copy_button.connect("clicked", self.on_copy_message)
             menu_box.append(copy_button)
-        
-        # Only show edit/unsend for own messages
-        if message.is_from_me:
-            if message.text:  # Only allow editing text messages
-                edit_button = Gtk.Button()
-                edit_button.set_label("Edit Message")
-                edit_button.add_css_class("flat")
-                edit_button.connect("clicked", self.on_edit_message, message, popover)
-                menu_box.append(edit_button)
+            
+            # Edit/unsend, only shown for my own messages
+            edit_button = Gtk.Button()
+            edit_button.set_label("Edit Message")
+            edit_button.add_css_class("flat")
+            edit_button.connect("clicked", self.on_edit_message)
+            menu_box.append(edit_button)
             
             unsend_button = Gtk.Button()
             unsend_button.set_label("Unsend Message")
             unsend_button.add_css_class("flat")
             unsend_button.add_css_class("destructive-action")
-            unsend_button.connect("clicked", self.on_unsend_message, message, popover)
+            unsend_button.connect("clicked", self.on_unsend_message)
             menu_box.append(unsend_button)
-        
-        popover.set_child(menu_box)
-        popover.popup()
-    
-    def on_reaction_selected(self, button, message, reaction_type, popover):
+            
+            self._context_popover = self.create_message_popover(menu_box)
+            self._context_popover.copy_button = copy_button
+            self._context_popover.edit_button = edit_button
+            self._context_popover.unsend_button = unsend_button
+        
+        popover = self._context_popover
+        popover.copy_button.set_visible(bool(message.text))
+        # Only allow editing text messages
+        popover.edit_button.set_visible(bool(message.is_from_me and message.text))
+        popover.unsend_button.set_visible(bool(message.is_from_me))
+        self.show_message_popover(popover, widget, message)
+    
+    def on_reaction_selected(self, button, reaction_type):
         """Handle reaction selection."""
+        popover = self._reaction_popover
         popover.popdown()
-        self.send_reaction_async(message.guid, reaction_type)
+        self.send_reaction_async(popover.message.guid, reaction_type)
     
-    def on_reaction_removed(self, button, message, popover):
+    def on_reaction_removed(self, button):
         """Handle reaction removal."""
+        popover = self._reaction_popover
         popover.popdown()
-        self.remove_reaction_async(message.guid)
+        self.remove_reaction_async(popover.message.guid)
     
-    def on_copy_message(self, button, message, popover):
+    def on_copy_message(self, button):
         """Handle copying message text."""
-        popover.popdown()
+        message = self._context_popover.message
+        self._context_popover.popdown()
         if message.text:
-            clipboard = Gdk.Display.get_default().get_clipboard()
-            clipboard.set(message.text)
+            if self._clipboard is None:
+                self._clipboard = Gdk.Display.get_default().get_clipboard()
+            self._clipboard.set(message.text)
             self.show_toast("Message copied to clipboard")
     
-    def on_edit_message(self, button, message, popover):
+    def on_edit_message(self, button):
         """Handle editing message."""
-        popover.popdown()
-        self.show_edit_dialog(message)
+        self._context_popover.popdown()
+        self.show_edit_dialog(self._context_popover.message)
     
-    def on_unsend_message(self, button, message, popover):
+    def on_unsend_message(self, button):
         """Handle unsending message."""
-        popover.popdown()
-        self.unsend_message_async(message.guid)
+        self._context_popover.popdown()
+        self.unsend_message_async(self._context_popover.message.guid)
     
     def show_edit_dialog(self, message):
         """Show dialog to edit a message."""
@@ -1306,375 +1688,400 @@ class MainWindow(Adw.ApplicationWindow):
         if not self.current_chat:
             return
         
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             self.show_toast("No server configuration")
             return
         
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                success = loop.run_until_complete(
-                    self.chat_service.send_message(
-                        config['url'], config['password'], 
-                        self.current_chat.guid, message_text
-                    )
-                )
-                loop.close()
-                
-                if success:
-                    # Immediate refresh
-                    GLib.idle_add(self.refresh_current_chat_messages)
-                    
-                    # Schedule additional refresh after 1 second to catch any delayed messages
-                    def delayed_refresh():
-                        # Force sync messages from server to get the latest
-                        def sync_and_refresh():
-                            try:
-                                loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
-                                loop.run_until_complete(
-                                    self.chat_service.sync_chat_messages(
-                                        config['url'], config['password'], 
-                                        self.current_chat.guid, limit=50
-                                    )
-                                )
-                                loop.close()
-                                
-                                # Refresh the message view
-                                GLib.idle_add(self.refresh_current_chat_messages)
-                            except Exception as e:
-                                pass  # Silently handle delayed refresh errors
-                        
-                        # Run sync in thread to avoid blocking
-                        import threading
-                        thread = threading.Thread(target=sync_and_refresh, daemon=True)
-                        thread.start()
-                        return False  # Don't repeat the timeout
-                    
-                    # Schedule the delayed refresh for 1 second later
-                    GLib.timeout_add_seconds(1, delayed_refresh)
-                else:
-                    GLib.idle_add(lambda: self.show_toast("Failed to send message"))
-            except Exception as e:
-                GLib.idle_add(lambda: self.show_toast(f"Error: {e}"))
+        self._submit(
+            self.send_message_task(
+                config['url'], config['password'], self.current_chat.guid, message_text
+            ),
+            on_error=lambda e: self.show_toast(f"Error: {e}")
+        )
+    
+    async def send_message_task(self, server_url: str, password: str, chat_guid: str, message_text: str):
+        """Send a message, refresh the open chat, then sync once more shortly after."""
+        success = await self.chat_service.send_message(
+            server_url, password, chat_guid, message_text
+        )
         
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+        if not success:
+            self._post_ui(self.show_toast, "Failed to send message")
+            return
+        
+        # Immediate refresh
+        self._post_ui(self.refresh_current_chat_messages)
+        
+        # Sync again after 1 second to catch any delayed messages
+        await asyncio.sleep(1.0)
+        try:
+            messages = await self.chat_service.sync_chat_messages(
+                server_url, password, chat_guid, limit=50
+            )
+        except Exception as e:
+            return  # Silently handle delayed refresh errors
+        
+        def refresh():
+            # The synced messages only apply if the chat is still open
+            if self.current_chat and self.current_chat.guid == chat_guid:
+                self.refresh_current_chat_messages(messages)
+        
+        # Refresh the message view with the messages the sync returned
+        self._post_ui(refresh)
     
     def send_attachment_async(self, file_path: str):
         """Send an attachment asynchronously."""
         if not self.current_chat:
             return
         
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             self.show_toast("No server configuration")
             return
         
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                success = loop.run_until_complete(
-                    self.chat_service.send_attachment(
-                        config['url'], config['password'], 
-                        self.current_chat.guid, file_path
-                    )
-                )
-                loop.close()
-                
-                if success:
-                    # Refresh the message view
-                    GLib.idle_add(self.refresh_current_chat_messages)
-                    GLib.idle_add(lambda: self.show_toast("Image sent"))
-                else:
-                    GLib.idle_add(lambda: self.show_toast("Failed to send image"))
-            except Exception as e:
-                GLib.idle_add(lambda: self.show_toast(f"Error: {e}"))
-        
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+        def on_sent(success):
+            if success:
+                # Refresh the message view
+                self.refresh_current_chat_messages()
+                self.show_toast("Image sent")
+            else:
+                self.show_toast("Failed to send image")
+        
+        self._submit(
+            self.chat_service.send_attachment(
+                config['url'], config['password'], self.current_chat.guid, file_path
+            ),
+            on_done=on_sent,
+            on_error=lambda e: self.show_toast(f"Error: {e}")
+        )
     
     def send_typing_indicator_async(self, typing: bool):
         """Send typing indicator asynchronously."""
         if not self.current_chat:
             return
         
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             return
         
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(
-                    self.chat_service.send_typing_indicator(
-                        config['url'], config['password'], 
-                        self.current_chat.guid, typing
-                    )
-                )
-                loop.close()
-            except Exception as e:
-                pass  # Silently handle typing indicator errors
-        
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+        # Don't resend a state the server already has for this chat
+        state = (self.current_chat.guid, typing)
+        if state == self._last_typing_sent:
+            return
+        self._last_typing_sent = state
+        
+        def typing_sent(success):
+            # Forget a state that didn't reach the server so the next keystroke retries it
+            if not success and self._last_typing_sent == state:
+                self._last_typing_sent = None
+        
+        self._submit(
+            self.chat_service.send_typing_indicator(
+                config['url'], config['password'], self.current_chat.guid, typing
+            ),
+            on_done=typing_sent,
+            on_error=lambda e: typing_sent(False)
+        )
+    
+    def get_avatar_key(self, chat: ChatRecord) -> tuple:
+        """Get the avatar cache key for a chat: its group icon, contact handle or initials."""
+        if chat.is_group_chat:
+            return ("group", chat.guid)
+        
+        # For individual chats, use the first participant's address
+        for participant in chat.participants:
+            # participant is a HandleRecord, use its address
+            address = participant.address
+            if '@' in address or address.startswith('+'):
+                return ("handle", address)
+        
+        return ("initials", chat.display_title or "Unknown")
+    
+    def cache_avatar_texture(self, key: tuple, texture: Gdk.Texture):
+        """Remember an avatar texture, evicting the least recently used."""
+        self._avatar_cache[key] = texture
+        self._avatar_cache.move_to_end(key)
+        if len(self._avatar_cache) > self.AVATAR_CACHE_SIZE:
+            self._avatar_cache.popitem(last=False)
+    
+    def load_chat_avatar_idle(self, image_widget: Gtk.Image, chat: ChatRecord):
+        """Idle callback that loads an avatar if its row still shows the chat."""
+        if image_widget.chat_guid == chat.guid:
+            self.load_chat_avatar_async(image_widget, chat)
+        return False  # Remove from idle queue
     
     def load_chat_avatar_async(self, image_widget: Gtk.Image, chat: ChatRecord):
         """Load chat avatar asynchronously."""
-        config = self.get_application().config_manager.get_server_config()
+        # A new token supersedes any earlier request made for this widget
+        token = object()
+        image_widget.avatar_token = token
+        
+        # Reuse an already decoded texture without touching a worker thread;
+        # chats with the same contact share one entry
+        key = self.get_avatar_key(chat)
+        texture = self._avatar_cache.get(key)
+        if texture is not None:
+            self._avatar_cache.move_to_end(key)
+            image_widget.set_from_paintable(texture)
+            return
+        
+        # Join a fetch that is already running for the same avatar
+        waiters = self._inflight_avatars.get(key)
+        if waiters is not None:
+            waiters.append((image_widget, token, chat.guid))
+            return
+        
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             return
         
-        def run_async():
+        self._inflight_avatars[key] = [(image_widget, token, chat.guid)]
+        
+        def update_avatar(avatar_data):
+            waiters = self._inflight_avatars.pop(key, [])
+            if not avatar_data:
+                return
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                avatar_data = None
-                
-                if chat.is_group_chat:
-                    # Try to get group chat icon
-                    avatar_data = loop.run_until_complete(
-                        self.chat_service.get_chat_icon(
-                            config['url'], config['password'], chat.guid
-                        )
-                    )
-                else:
-                    # For individual chats, use the first participant's address
-                    participants = chat.participants
-                    if participants and len(participants) > 0:
-                        # Find the participant that's not us
-                        for participant in participants:
-                            # participant is a HandleRecord, use its address
-                            address = participant.address if hasattr(participant, 'address') else str(participant)
-                            if '@' in address or address.startswith('+'):
-                                avatar_data = loop.run_until_complete(
-                                    self.chat_service.get_contact_avatar(
-                                        config['url'], config['password'], address
-                                    )
-                                )
-                                break
-                
-                # If no avatar data, try to generate initials fallback
-                if not avatar_data:
-                    fallback_name = chat.display_title or "Unknown"
-                    avatar_data = self.chat_service.generate_fallback_avatar(fallback_name, 40)
-                
-                loop.close()
-                
-                # Update UI on main thread
-                if avatar_data:
-                    def update_avatar():
-                        try:
-                            # Check if the widget is still valid
-                            if image_widget and not image_widget.get_parent() is None:
-                                new_image = self.load_image_from_data(avatar_data, 40)
-                                # Copy properties from new image to existing widget
-                                paintable = new_image.get_paintable()
-                                if paintable:
-                                    image_widget.set_from_paintable(paintable)
-                        except Exception as e:
-                            pass  # Silently handle UI update errors
-                        return False  # Remove from idle queue
-                    
-                    GLib.idle_add(update_avatar)
+                # Textures are created on the main thread and cached
+                # so the avatar is only decoded once
+                texture = Gdk.Texture.new_from_bytes(GLib.Bytes.new(avatar_data))
+                self.cache_avatar_texture(key, texture)
                 
+                for widget, widget_token, chat_guid in waiters:
+                    # Check the widget is still shown and not recycled for another chat
+                    if (widget.avatar_token is widget_token and widget.get_parent() is not None
+                            and widget.chat_guid == chat_guid):
+                        widget.set_from_paintable(texture)
             except Exception as e:
-                pass  # Silently handle avatar loading errors
+                pass  # Silently handle UI update errors
         
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+        # Avatar loading errors are ignored; the placeholder icon stays
+        self._submit(
+            self.fetch_avatar(config['url'], config['password'], key, chat.display_title or "Unknown"),
+            on_done=update_avatar,
+            on_error=lambda e: self._inflight_avatars.pop(key, None)
+        )
+    
+    def is_avatar_wanted(self, key: tuple) -> bool:
+        """Check whether any widget is still waiting for an in-flight avatar."""
+        return any(
+            widget.avatar_token is token
+            for widget, token, _ in list(self._inflight_avatars.get(key, ()))
+        )
+    
+    async def fetch_avatar(self, server_url: str, password: str, key: tuple, fallback_name: str) -> bytes:
+        """Fetch avatar image data for a cache key, falling back to generated initials."""
+        # Rows scrolled away or rebound before we got here no longer need it
+        if not self.is_avatar_wanted(key):
+            return None
+        
+        kind, identifier = key
+        avatar_data = None
+        
+        if kind == "group":
+            # Try to get group chat icon
+            avatar_data = await self.chat_service.get_chat_icon(server_url, password, identifier)
+        elif kind == "handle":
+            avatar_data = await self.chat_service.get_contact_avatar(server_url, password, identifier)
+        
+        # If no avatar data, try to generate initials fallback
+        if not avatar_data and self.is_avatar_wanted(key):
+            avatar_data = self.chat_service.generate_fallback_avatar(fallback_name, 40)
+        
+        return avatar_data
+    
+    def queue_action(self, key, make_coro, on_done=None, on_error=None):
+        """Queue a server action to run in order after the ones before it.
+        
+        make_coro() creates the coroutine once the worker gets to it. An action
+        whose key matches the last queued one, still waiting, is dropped; only
+        a repeat of the newest action can be collapsed without changing the
+        outcome of the actions queued in between. A key of None never collapses.
+        on_done(result) and on_error(exception) are called on the GTK main loop.
+        """
+        self._loop.call_soon_threadsafe(self._put_action, (key, make_coro, on_done, on_error))
+    
+    def _put_action(self, action):
+        """Add an action to the queue; runs on the event loop thread."""
+        if self._action_queue is None:
+            self._action_queue = asyncio.Queue(maxsize=self.ACTION_QUEUE_SIZE)
+            self._action_worker_task = self._loop.create_task(self._action_worker())
+        
+        key, _, _, on_error = action
+        if key is not None and key == self._last_queued_action_key:
+            return  # The same action is already waiting
+        
+        try:
+            self._action_queue.put_nowait(action)
+        except asyncio.QueueFull:
+            if on_error:
+                self._post_ui(on_error, RuntimeError("Too many pending actions"))
+            return
+        self._last_queued_action_key = key
+    
+    async def _action_worker(self):
+        """Run queued server actions one at a time."""
+        action_queue = self._action_queue
+        while True:
+            key, make_coro, on_done, on_error = await action_queue.get()
+            if action_queue.empty():
+                # The last queued action is running; a repeat must queue again
+                self._last_queued_action_key = None
+            try:
+                result = await make_coro()
+            except Exception as e:
+                if on_error:
+                    self._post_ui(on_error, e)
+            else:
+                if on_done:
+                    self._post_ui(on_done, result)
+            finally:
+                action_queue.task_done()
+    
+    def _stop_action_worker(self):
+        """Cancel the action worker and drop queued actions; runs on the event loop thread."""
+        if self._action_worker_task is not None:
+            self._action_worker_task.cancel()
+            self._action_worker_task = None
+        self._action_queue = None
+        self._last_queued_action_key = None
     
     def mark_chat_read_async(self, chat_guid: str):
         """Mark a chat as read asynchronously."""
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             return
         
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(
-                    self.chat_service.mark_chat_read(
-                        config['url'], config['password'], chat_guid
-                    )
-                )
-                loop.close()
-            except Exception as e:
-                pass  # Silently handle mark read errors
+        # Repeated requests for the same chat collapse while queued;
+        # mark read errors are silently ignored
+        self.queue_action(
+            ('mark_read', chat_guid),
+            functools.partial(
+                self.chat_service.mark_chat_read, config['url'], config['password'], chat_guid
+            )
+        )
+    
+    def submit_message_action(self, key, make_coro, success_text: str, failure_text: str):
+        """Queue a message action, then refresh and report the outcome."""
+        def action_done(success):
+            if success:
+                # Refresh messages to show the change
+                self.refresh_current_chat_messages()
+                self.show_toast(success_text)
+            else:
+                self.show_toast(failure_text)
         
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+        self.queue_action(
+            key,
+            make_coro,
+            on_done=action_done,
+            on_error=lambda e: self.show_toast(f"Error: {e}")
+        )
     
     def send_reaction_async(self, message_guid: str, reaction_type: str):
         """Send a reaction asynchronously."""
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             self.show_toast("No server configuration")
             return
         
         # Get the current chat GUID
         chat_guid = self.current_chat.guid if self.current_chat else None
-        # print(f"🎭 UI: Starting send reaction - guid={message_guid}, type={reaction_type}, chat_guid={chat_guid}")
-        
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                success = loop.run_until_complete(
-                    self.chat_service.send_reaction(
-                        config['url'], config['password'], 
-                        message_guid, reaction_type, chat_guid
-                    )
-                )
-                loop.close()
-                
-                if success:
-                    # print(f"✅ UI: Reaction sent successfully")
-                    # Refresh messages to show the new reaction
-                    GLib.idle_add(self.refresh_current_chat_messages)
-                    GLib.idle_add(lambda: self.show_toast("Reaction sent"))
-                else:
-                    # print(f"❌ UI: Failed to send reaction")
-                    GLib.idle_add(lambda: self.show_toast("Failed to send reaction"))
-            except Exception as e:
-                # print(f"❌ UI: Exception sending reaction: {e}")
-                GLib.idle_add(lambda: self.show_toast(f"Error: {e}"))
         
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+        # No key: reactions on one message don't commute (love, remove, love
+        # must end on love), so every tap runs in order instead of collapsing
+        self.submit_message_action(
+            None,
+            functools.partial(
+                self.chat_service.send_reaction,
+                config['url'], config['password'], 
+                message_guid, reaction_type, chat_guid
+            ),
+            "Reaction sent",
+            "Failed to send reaction"
+        )
     
     def remove_reaction_async(self, message_guid: str):
         """Remove a reaction asynchronously."""
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             self.show_toast("No server configuration")
             return
         
         # Get the current chat GUID
         chat_guid = self.current_chat.guid if self.current_chat else None
-        # print(f"🎭 UI: Starting remove reaction - guid={message_guid}, chat_guid={chat_guid}")
-        
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                success = loop.run_until_complete(
-                    self.chat_service.remove_reaction(
-                        config['url'], config['password'], 
-                        message_guid, chat_guid
-                    )
-                )
-                loop.close()
-                
-                if success:
-                    # print(f"✅ UI: Reaction removed successfully")
-                    # Refresh messages to show the reaction removal
-                    GLib.idle_add(self.refresh_current_chat_messages)
-                    GLib.idle_add(lambda: self.show_toast("Reaction removed"))
-                else:
-                    # print(f"❌ UI: Failed to remove reaction")
-                    GLib.idle_add(lambda: self.show_toast("Failed to remove reaction"))
-            except Exception as e:
-                # print(f"❌ UI: Exception removing reaction: {e}")
-                GLib.idle_add(lambda: self.show_toast(f"Error: {e}"))
         
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+        # No key, like send_reaction_async: the order of reaction taps matters
+        self.submit_message_action(
+            None,
+            functools.partial(
+                self.chat_service.remove_reaction,
+                config['url'], config['password'], 
+                message_guid, chat_guid
+            ),
+            "Reaction removed",
+            "Failed to remove reaction"
+        )
     
     def edit_message_async(self, message_guid: str, new_text: str):
         """Edit a message asynchronously."""
         if not self.current_chat:
             return
         
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             self.show_toast("No server configuration")
             return
         
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                success = loop.run_until_complete(
-                    self.chat_service.edit_message(
-                        config['url'], config['password'], 
-                        message_guid, new_text, self.current_chat.guid
-                    )
-                )
-                loop.close()
-                
-                if success:
-                    # Refresh the message view
-                    GLib.idle_add(self.refresh_current_chat_messages)
-                    GLib.idle_add(lambda: self.show_toast("Message edited"))
-                else:
-                    GLib.idle_add(lambda: self.show_toast("Failed to edit message"))
-            except Exception as e:
-                GLib.idle_add(lambda: self.show_toast(f"Error: {e}"))
-        
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+        self.submit_message_action(
+            ('edit', message_guid, new_text),
+            functools.partial(
+                self.chat_service.edit_message,
+                config['url'], config['password'], 
+                message_guid, new_text, self.current_chat.guid
+            ),
+            "Message edited",
+            "Failed to edit message"
+        )
     
     def unsend_message_async(self, message_guid: str):
         """Unsend a message asynchronously."""
         if not self.current_chat:
             return
         
-        config = self.get_application().config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             self.show_toast("No server configuration")
             return
         
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                success = loop.run_until_complete(
-                    self.chat_service.unsend_message(
-                        config['url'], config['password'], 
-                        message_guid, self.current_chat.guid
-                    )
-                )
-                loop.close()
-                
-                if success:
-                    # Refresh the message view
-                    GLib.idle_add(self.refresh_current_chat_messages)
-                    GLib.idle_add(lambda: self.show_toast("Message unsent"))
-                else:
-                    GLib.idle_add(lambda: self.show_toast("Failed to unsend message"))
-            except Exception as e:
-                GLib.idle_add(lambda: self.show_toast(f"Error: {e}"))
-        
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
-    
-    def refresh_current_chat_messages(self):
-        """Refresh messages for the current chat."""
-        if not self.current_chat:
-            return
-        
-        current_page = self.content_stack.get_visible_child()
-        if not current_page:
-            return
-        
-        messages_box = getattr(current_page, 'messages_box', None)
-        messages_area = getattr(current_page, 'messages_area', None)
-        
-        if messages_box and messages_area:
-            self.load_chat_messages(self.current_chat, messages_box, messages_area)
+        self.submit_message_action(
+            ('unsend', message_guid),
+            functools.partial(
+                self.chat_service.unsend_message,
+                config['url'], config['password'], 
+                message_guid, self.current_chat.guid
+            ),
+            "Message unsent",
+            "Failed to unsend message"
+        )
     
-    def create_about_dialog(self, server_info: dict, icloud_info: dict = None, statistics: dict = None):
-        """Create and show the about dialog with the fetched information."""
+    def create_about_dialog(self, body_text: str):
+        """Create and show the about dialog with the already formatted information."""
         dialog = Adw.AlertDialog()
         dialog.set_heading("About BlueBubbles")
+        dialog.set_body(body_text)
+        
+        # Add close button
+        dialog.add_response("close", "Close")
+        dialog.set_default_response("close")
         
+        # Show the dialog
+        dialog.present(self)
+    
+    @staticmethod
+    def format_about_body(server_info: dict, icloud_info: dict = None, statistics: dict = None) -> str:
+        """Build the about dialog text; pure string work, so it can run off the main thread."""
         # Build the information text
         info_parts = []
         # Server Information
@@ -1724,39 +2131,30 @@ class MainWindow(Adw.ApplicationWindow):
             info_parts.append("Statistics unavailable")
         
         # Join all parts with newlines
-        body_text = "\n".join(info_parts)
-        dialog.set_body(body_text)
-        
-        # Add close button
-        dialog.add_response("close", "Close")
-        dialog.set_default_response("close")
-        
-        # Show the dialog
-        dialog.present(self)
+        return "\n".join(info_parts)
     
     async def load_server_info_async(self, url: str, password: str):
         """Load server information asynchronously."""
         try:
-            api_method = self.get_application().config_manager.get_api_method()
-            async with BlueBubblesClient(url, password, api_method) as client:
+            async with self.chat_service.client(url, password) as client:
                 server_info = await client.get_server_info()
                 version = server_info.get('server_version', 'Unknown')
                 
                 def update_title():
                     self.set_title(f"BlueBubbles - Server v{version}")
                 
-                GLib.idle_add(update_title)
+                self._post_ui(update_title)
         
         except Exception as e:
             error_msg = str(e)
             def show_error():
                 self.show_toast(f"Failed to load server info: {error_msg}")
             
-            GLib.idle_add(show_error)
+            self._post_ui(show_error)
 
     def start_message_monitoring(self):
         """Start background message monitoring."""
-        config = self.config_manager.get_server_config()
+        config = self.get_server_config()
         if not config['url'] or not config['password']:
             # print("⚠️  Cannot start message monitoring: No server configuration")
             return
@@ -1781,34 +2179,58 @@ class MainWindow(Adw.ApplicationWindow):
         # print(f"📨 New message detected in chat: {chat_guid}")
         
         # Update the UI on the main thread
-        def update_ui():
+        self._post_ui(self.queue_new_message, chat_guid)
+    
+    def queue_new_message(self, chat_guid: str):
+        """Collect a chat with new messages; bursts are applied in one debounced update."""
+        # Re-insert so the most recent arrival ends up last, i.e. on top
+        self._pending_new_chats.pop(chat_guid, None)
+        self._pending_new_chats[chat_guid] = None
+        
+        if not self._new_message_flush_id:
+            self._new_message_flush_id = GLib.timeout_add(
+                self.NEW_MESSAGE_DEBOUNCE_MS, self.flush_new_messages
+            )
+    
+    def flush_new_messages(self):
+        """Move every chat with new messages to the top and refresh the open chat once."""
+        self._new_message_flush_id = 0
+        chat_guids = list(self._pending_new_chats)
+        self._pending_new_chats.clear()
+        
+        updated_chats = []
+        for chat_guid in chat_guids:
             # Get the updated chat with the new message
             updated_chat = self.chat_service.get_chat_by_guid(chat_guid)
             if not updated_chat:
                 # print(f"⚠️  Could not find chat {chat_guid} after new message")
-                return
+                continue
             
             # Update chat in our local list and move it to the top
             self.move_chat_to_top(updated_chat)
-            
-            # If this is the currently selected chat, refresh the messages
-            if self.current_chat and self.current_chat.guid == chat_guid:
-                self.refresh_current_chat_messages()
-            
-            # Show a toast notification
-            chat_name = updated_chat.display_name if updated_chat.display_name else chat_guid[:8]
+            updated_chats.append(updated_chat)
+        
+        if not updated_chats:
+            return False
+        
+        # If the currently selected chat got messages, refresh it once
+        if self.current_chat and self.current_chat.guid in chat_guids:
+            self.refresh_current_chat_messages()
+        
+        # Show a single toast notification for the whole burst
+        if len(updated_chats) == 1:
+            chat = updated_chats[0]
+            chat_name = chat.display_name if chat.display_name else chat.guid[:8]
             self.show_toast(f"New message in {chat_name}")
+        else:
+            self.show_toast(f"New messages in {len(updated_chats)} chats")
         
-        GLib.idle_add(update_ui)
+        return False  # Remove the timeout
     
     def move_chat_to_top(self, updated_chat):
         """Move a chat to the top of the list and update its preview."""
         # Find the existing chat in our local list
-        chat_index = -1
-        for i, chat in enumerate(self.chats):
-            if chat.guid == updated_chat.guid:
-                chat_index = i
-                break
+        chat_index = self._chat_index.get(updated_chat.guid, -1)
         
         if chat_index >= 0:
             # Remove the old chat from the list
@@ -1825,153 +2247,148 @@ class MainWindow(Adw.ApplicationWindow):
     
     def update_chat_list_order(self, updated_chat, old_index):
         """Efficiently update the chat list order without full rebuild."""
-        # Find the existing row in the UI
-        existing_row = None
-        if old_index >= 0:
-            # Find the row by comparing chat GUIDs
-            child = self.chat_list.get_first_child()
-            current_index = 0
-            while child:
-                if hasattr(child, 'chat') and child.chat.guid == updated_chat.guid:
-                    existing_row = child
-                    break
-                child = child.get_next_sibling()
-                current_index += 1
-        
-        if existing_row:
-            # Remove the existing row
-            self.chat_list.remove(existing_row)
-            # print(f"🔄 Removed existing chat row for {updated_chat.display_title}")
-        
-        # Create a new row with updated data and insert at the top
-        new_row = self.create_chat_row(updated_chat)
-        self.chat_list.insert(new_row, 0)
-        # print(f"⬆️ Moved {updated_chat.display_title} to top of chat list")
-        
-        # Update the selection if this was the current chat
-        if self.current_chat and self.current_chat.guid == updated_chat.guid:
-            self.chat_list.select_row(new_row)
-            # Update the current_chat reference
-            self.current_chat = updated_chat
-    
-    def refresh_current_chat_messages(self):
-        """Refresh messages for the currently selected chat."""
+        # The store is kept in the same order as self.chats, so old_index is
+        # the chat's position in it. Moving rows shifts the selection, which
+        # must not reopen or re-mark the chat that is already open.
+        self._restoring_selection = True
+        try:
+            if old_index == 0:
+                # Already on top; just refresh the row in place
+                item = self.chat_store.get_item(0)
+                item.chat = updated_chat
+                if item.row is not None:
+                    self.bind_chat_row(item.row, updated_chat)
+            elif old_index > 0:
+                self.chat_store.remove(old_index)
+                # print(f"🔄 Removed existing chat row for {updated_chat.display_title}")
+                self.chat_store.insert(0, ChatListItem(updated_chat))
+                # Only the chats above the old position moved down by one
+                self.reindex_chats(old_index + 1)
+            else:
+                self.chat_store.insert(0, ChatListItem(updated_chat))
+                self.reindex_chats()
+            # print(f"⬆️ Moved {updated_chat.display_title} to top of chat list")
+            
+            # Update the selection if this was the current chat
+            if self.current_chat and self.current_chat.guid == updated_chat.guid:
+                self.chat_selection.set_selected(0)
+                # Update the current_chat reference
+                self.current_chat = updated_chat
+        finally:
+            self._restoring_selection = False
+    
+    def refresh_current_chat_messages(self, messages: list = None):
+        """Refresh messages for the currently selected chat.
+        
+        messages may be passed in when the caller already has the chat's cached
+        messages; otherwise they are read from the cache.
+        """
         if not self.current_chat:
             # print("❌ No current chat selected")
             return
         
         # print(f"🔄 Refreshing messages for current chat: {self.current_chat.display_title}")
         
-        # Reload messages from cache (they should already be updated by the background task)
-        messages = self.chat_service.get_cached_chat_messages(self.current_chat.guid, limit=50)
-        # print(f"📥 Retrieved {len(messages)} messages from cache")
+        if messages is None:
+            # Reload messages from cache (they should already be updated by the background task)
+            messages = self.chat_service.get_cached_chat_messages(self.current_chat.guid, limit=50)
+            # print(f"📥 Retrieved {len(messages)} messages from cache")
+        
+        # Update the message list of the chat's cached view
+        chat_view = self._chat_view_lru.get(self.current_chat.guid)
+        if chat_view is None:
+            return  # Silently handle missing chat view
+        handles = chat_view.handles
+        
+        # Skip the widget and reaction pass when the cache returned the
+        # same messages as the last refresh of this view
+        signature = tuple(m.guid for m in messages)
+        if getattr(handles.messages_box, 'refresh_signature', None) == signature:
+            return
+        handles.messages_box.refresh_signature = signature
         
-        # Update the message list using the correct chat view name
-        chat_view_name = f"chat_{self.current_chat.guid}"
-        chat_view = self.content_stack.get_child_by_name(chat_view_name)
-        # print(f"🎯 Looking for chat view: {chat_view_name}")
-        # print(f"🎯 Chat view found: {chat_view is not None}")
+        # Add new messages efficiently
+        self.add_new_messages_to_chat(handles.messages_box, messages)
         
-        if chat_view:
-            has_messages_box = hasattr(chat_view, 'messages_box')
-            # print(f"📦 Chat view has messages_box: {has_messages_box}")
-            
-            if has_messages_box:
-                # Add new messages efficiently
-                self.add_new_messages_to_chat(chat_view.messages_box, messages)
-                
-                # Scroll to bottom if we have the messages_area
-                if hasattr(chat_view, 'messages_area'):
-                    GLib.idle_add(self.scroll_to_bottom, chat_view.messages_area)
-            else:
-                pass  # Silently handle missing messages_box
-        else:
-            pass  # Silently handle missing chat view
+        GLib.idle_add(self.scroll_to_bottom, handles.messages_area)
     
     def add_new_messages_to_chat(self, messages_box, new_messages):
         """Efficiently add new messages to the chat without clearing everything."""
         # print(f"🔍 Checking for new messages to add. Total messages from cache: {len(new_messages)}")
         
-    # Ignore reaction-only events; they will be reflected as badges on their parent messages
-        new_messages = [m for m in new_messages if not self.is_reaction_event(m)]
-
-        # Get currently displayed messages by checking existing children
-        existing_guids = set()
-        child_count = 0
-        child = messages_box.get_first_child()
-        while child:
-            child_count += 1
-            if hasattr(child, 'message_guid'):
-                existing_guids.add(child.message_guid)
-                # Silently track existing messages
-            else:
-                # Silently handle children without message_guid
-                pass
-            child = child.get_next_sibling()
+        # Currently displayed messages are tracked in the box's message index,
+        # so one pass partitions the batch into reaction events (tapbacks), which
+        # are only reflected as badges on their parent messages, new messages
+        # and already shown messages
+        index = self.get_message_index(messages_box)
         
-        # print(f"🔍 Currently displayed widgets: {child_count}, with message GUIDs: {len(existing_guids)}")
+        # print(f"🔍 Currently displayed message GUIDs: {len(index)}")
         
-        # Find truly new messages
+        reaction_guids = set()
         messages_to_add = []
+        displayed = []
+        get_widget = index.get
         for message in new_messages:
-            if message.guid not in existing_guids:
+            if message.associated_message_guid and message.associated_message_type:
+                reaction_guids.add(message.guid)
+                continue
+            widget = get_widget(message.guid)
+            if widget is None:
                 messages_to_add.append(message)
-                # print(f"🔍 New message found: {message.guid} - {message.text[:50] if message.text else 'No text'}...")
             else:
-                # Silently skip already displayed messages
-                pass
+                displayed.append((widget, message))
+        
+        # Reaction badges only need recomputing when the reaction events in the
+        # cache differ from the ones seen at the last refresh of this box
+        reactions_dirty = reaction_guids != getattr(messages_box, 'reaction_event_guids', None)
+        
+        # Nothing new to show and no reaction changed: leave the view alone
+        if not messages_to_add and not reactions_dirty:
+            return
         
         if messages_to_add:
             # print(f"➕ Adding {len(messages_to_add)} new messages to chat")
             
             # Sort by date to maintain chronological order
-            messages_to_add.sort(key=lambda m: m.date_created)
+            messages_to_add.sort(key=attrgetter('date_created'))
             
             # Add new messages at the bottom
+            now = datetime.now()
+            create_widget = self.create_message_widget
+            append = messages_box.append
             for message in messages_to_add:
-                message_widget = self.create_message_widget(message)
+                message_widget = create_widget(message, now)
                 # Store the message GUID for future reference
                 message_widget.message_guid = message.guid
-                messages_box.append(message_widget)
+                index[message.guid] = message_widget
+                append(message_widget)
                 # print(f"➕ Added message widget for: {message.guid}")
+            
+            self.trim_message_widgets(messages_box)
         else:
             # Silently handle case where no new messages need to be added
             pass
 
-        # After adding/confirming messages, update reaction badges for all visible messages
-        # to reflect any recent reaction changes.
-        child = messages_box.get_first_child()
-        while child:
-            try:
-                if hasattr(child, 'message_guid'):
-                    guid = child.message_guid
-                    # Lookup the corresponding message data
-                    msg = next((m for m in new_messages if m.guid == guid), None)
-                    if msg is None:
-                        child = child.get_next_sibling()
-                        continue
-                    # Recalculate reactions for this message
-                    reactions = self.chat_service.get_message_reactions(guid)
-                    # Build the updated reactions widget
-                    if reactions:
-                        updated = self.create_reactions_widget(reactions, msg.is_from_me)
-                    else:
-                        updated = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
-                        if msg.is_from_me:
-                            updated.set_halign(Gtk.Align.END)
-                        else:
-                            updated.set_halign(Gtk.Align.START)
-                    # Replace existing reactions widget if we have a reference
-                    if hasattr(child, 'reactions_widget'):
-                        try:
-                            child.remove(child.reactions_widget)
-                        except Exception:
-                            pass
-                        child.reactions_widget = updated
-                        child.append(updated)
-            except Exception:
-                pass
-            child = child.get_next_sibling()
+        # After adding/confirming messages, update reaction badges for the messages
+        # that were already shown to reflect any recent reaction changes; new
+        # widgets got theirs when they were created.
+        if not reactions_dirty:
+            return
+        messages_box.reaction_event_guids = reaction_guids
+        
+        # Widgets trimmed above are no longer in the box
+        displayed = [(widget, message) for widget, message in displayed if widget.get_parent() is not None]
+        if not displayed:
+            return
+        
+        # Fetch all their reactions in one query
+        reactions_by_guid = self.chat_service.get_message_reactions_bulk(
+            [message.guid for _, message in displayed]
+        )
+        update_reactions = self.update_message_reactions
+        get_reactions = reactions_by_guid.get
+        for widget, message in displayed:
+            update_reactions(widget, message, get_reactions(message.guid, []))
     
     def on_window_destroy(self, window):
         """Called when the window is being destroyed."""
@@ -1980,5 +2397,18 @@ class MainWindow(Adw.ApplicationWindow):
         # Stop message monitoring
         self.chat_service.stop_message_checking()
         
-        # Remove callback
+        # Cancel async work still pending for this window; the shared loop
+        # itself is stopped by the application on shutdown
+        for future in list(self._pending_futures):
+            future.cancel()
+        self._pending_futures.clear()
+        self._loop.call_soon_threadsafe(self._stop_action_worker)
+        
+        # Drop a pending new-message update
+        if self._new_message_flush_id:
+            GLib.source_remove(self._new_message_flush_id)
+            self._new_message_flush_id = 0
+        
+        # Remove callbacks
         self.chat_service.remove_new_message_callback(self.on_new_message_detected)
+        self.config_manager.remove_change_callback(self.on_config_changed)
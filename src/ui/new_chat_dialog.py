@@ -7,10 +7,53 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GLib
+from gi.repository import Gtk, Adw
 import asyncio
-import threading
-from ..api.client import BlueBubblesClient, BlueBubblesAPIError
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from ..api.client import BlueBubblesAPIError
+
+# Contact addresses per server URL, shared by every dialog: (fetched at, addresses)
+CONTACTS_CACHE_TTL = 60.0
+_contacts_cache: Dict[str, Tuple[float, List[str]]] = {}
+# Contact fetches still running on the shared loop, so concurrent dialogs share one request
+_contacts_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def _fetch_contacts(chat_service, server_url: str, password: str, api_method: str,
+                          on_progress: Optional[Callable[[List[str]], None]] = None) -> List[str]:
+    """
+    Fetch the sorted addresses of existing contacts and cache them.
+    
+    on_progress, if given, gets the addresses first seen in each page of
+    handles, so the dropdown fills in before the last page arrives.
+    """
+    addresses = set()
+    async with chat_service.client(server_url, password, api_method) as client:
+        try:
+            # Handles are much smaller than chats with embedded participants
+            async for handles in client.iter_handles():
+                page_addresses = {handle['address'] for handle in handles if handle.get('address')}
+                new_addresses = sorted(page_addresses - addresses)
+                addresses |= page_addresses
+                if on_progress and new_addresses:
+                    on_progress(new_addresses)
+        except BlueBubblesAPIError:
+            if addresses:
+                raise
+            # Older servers: extract participants from recent chats
+            chats = await client.get_chats(limit=200, with_data=['participants'])
+            addresses = {
+                participant['address']
+                for chat in chats
+                for participant in chat.get('participants', ())
+                if participant.get('address')
+            }
+    
+    # Sort addresses
+    sorted_addresses = sorted(addresses)
+    _contacts_cache[server_url] = (time.monotonic(), sorted_addresses)
+    return sorted_addresses
 
 
 class NewChatDialog(Adw.Dialog):
@@ -22,6 +65,22 @@ class NewChatDialog(Adw.Dialog):
         self.parent_window = parent_window
         self.config_manager = config_manager
         self.contacts = []
+        # Set while the dialog itself changes the contacts model, so the
+        # selection changes it causes don't overwrite the contact entry
+        self._updating_contacts = False
+        self._has_contacts = False
+        self._picked_contact = None
+        
+        # Network work goes through the main window's _submit, which runs it on
+        # the application's shared event loop and posts results back via _post_ui
+        self.application = parent_window.get_application()
+        self.chat_service = self.application.get_chat_service()
+        
+        # Snapshot the settings used by every request; refreshed if they change
+        self._server_config = config_manager.get_server_config()
+        self._api_method = config_manager.get_api_method()
+        config_manager.add_change_callback(self.on_config_changed)
+        self.connect("closed", self.on_closed)
         
         self.set_title("New Chat")
         self.set_content_width(400)
@@ -30,6 +89,18 @@ class NewChatDialog(Adw.Dialog):
         self.setup_ui()
         self.load_contacts()
     
+    def on_config_changed(self, key: str):
+        """Refresh the settings snapshot when a server or API setting changes."""
+        section = key.split('.', 1)[0]
+        if section == 'server':
+            self._server_config = self.config_manager.get_server_config()
+        elif section == 'advanced':
+            self._api_method = self.config_manager.get_api_method()
+    
+    def on_closed(self, dialog):
+        """Stop listening for configuration changes."""
+        self.config_manager.remove_change_callback(self.on_config_changed)
+    
     def setup_ui(self):
         """Set up the dialog UI."""
         # Main content box
@@ -70,9 +141,18 @@ class NewChatDialog(Adw.Dialog):
         self.contacts_dropdown.set_hexpand(True)
         
         # Create string list for contacts
-        self.contacts_model = Gtk.StringList()
+        # Starts with the loading placeholder until load_contacts fills it
+        self.contacts_model = Gtk.StringList.new(["Loading contacts..."])
         self.contacts_dropdown.set_model(self.contacts_model)
         
+        # Type-to-filter in the popover instead of scrolling every address
+        self.contacts_dropdown.set_expression(
+            Gtk.PropertyExpression.new(Gtk.StringObject, None, "string")
+        )
+        self.contacts_dropdown.set_enable_search(True)
+        if hasattr(self.contacts_dropdown, 'set_search_match_mode'):  # GTK 4.12+
+            self.contacts_dropdown.set_search_match_mode(Gtk.StringFilterMatchMode.SUBSTRING)
+        
         # Connect dropdown selection to entry
         self.contacts_dropdown.connect("notify::selected-item", self.on_contact_selected)
         
@@ -134,10 +214,14 @@ class NewChatDialog(Adw.Dialog):
     
     def on_contact_selected(self, dropdown, param):
         """Handle contact selection from dropdown."""
+        if self._updating_contacts:
+            # The model is being refilled; the user didn't pick anything
+            return
         selected_item = dropdown.get_selected_item()
         if selected_item:
             contact_text = selected_item.get_string()
             if contact_text != "Loading contacts...":
+                self._picked_contact = contact_text
                 # Extract the address from the contact text
                 # Format is usually "Name - address" or just "address"
                 if " - " in contact_text:
@@ -149,10 +233,14 @@ class NewChatDialog(Adw.Dialog):
     
     def on_entry_changed(self, entry):
         """Handle entry text changes to validate input."""
-        contact_text = self.contact_entry.get_text().strip()
-        message_text = self.message_entry.get_text().strip()
-        # Enable create button if both fields have text
-        self.create_button.set_sensitive(len(contact_text) > 0 and len(message_text) > 0)
+        contact_text = self.contact_entry.get_text()
+        message_text = self.message_entry.get_text()
+        # Enable create button if both fields have non-whitespace text;
+        # isspace() checks that without copying the text like strip() does
+        self.create_button.set_sensitive(
+            bool(contact_text) and not contact_text.isspace()
+            and bool(message_text) and not message_text.isspace()
+        )
     
     def on_cancel_clicked(self, button):
         """Handle cancel button click."""
@@ -185,134 +273,116 @@ class NewChatDialog(Adw.Dialog):
     
     def load_contacts(self):
         """Load existing contacts from the server."""
-        # Add placeholder while loading
-        self.contacts_model.append("Loading contacts...")
-        
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.load_contacts_async())
-                loop.close()
-            except Exception as e:
-                def show_error():
-                    self.contacts_model.remove(0)  # Remove "Loading..." item
-                    self.contacts_model.append("Failed to load contacts")
-                GLib.idle_add(show_error)
-        
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
-    
-    async def load_contacts_async(self):
-        """Load contacts asynchronously."""
-        config = self.config_manager.get_server_config()
+        config = self._server_config
         if not config['url'] or not config['password']:
-            def update_ui():
-                self.contacts_model.remove(0)  # Remove "Loading..." item
-                self.contacts_model.append("No server configuration")
-            GLib.idle_add(update_ui)
+            self.set_contact_items(["No server configuration"])
             return
         
+        cached = _contacts_cache.get(config['url'])
+        if cached and time.monotonic() - cached[0] < CONTACTS_CACHE_TTL:
+            self.show_contacts(cached[1])
+            return
+        
+        self.parent_window._submit(
+            self.load_contacts_async(config['url'], config['password'], self._api_method),
+            self.show_contacts,
+            self.on_contacts_failed
+        )
+    
+    async def load_contacts_async(self, server_url: str, password: str, api_method: str):
+        """Fetch the sorted addresses of existing contacts, joining a fetch already in flight."""
+        fetch = _contacts_inflight.get(server_url)
+        if fetch is None:
+            fetch = asyncio.ensure_future(_fetch_contacts(
+                self.chat_service, server_url, password, api_method,
+                on_progress=self.post_contacts
+            ))
+            _contacts_inflight[server_url] = fetch
+            fetch.add_done_callback(lambda _: _contacts_inflight.pop(server_url, None))
+        # Shielded so one dialog going away doesn't cancel the fetch for the others
+        return await asyncio.shield(fetch)
+    
+    def post_contacts(self, new_addresses):
+        """Show a page of newly loaded contacts; called on the event loop thread."""
+        self.parent_window._post_ui(self.append_contacts, new_addresses)
+    
+    def append_contacts(self, new_addresses):
+        """Add a page of contacts after the ones already shown."""
+        if not self._has_contacts:
+            # Replace the loading placeholder
+            self.set_contact_items(new_addresses)
+            self._has_contacts = True
+            return
+        self._updating_contacts = True
         try:
-            api_method = self.application.config_manager.get_api_method()
-            async with BlueBubblesClient(config['url'], config['password'], api_method) as client:
-                # Get chats to extract contacts
-                chats = await client.get_chats(limit=200, with_data=['participants'])
-                
-                # Extract unique handles/addresses
-                addresses = set()
-                for chat in chats:
-                    participants = chat.get('participants', [])
-                    for participant in participants:
-                        address = participant.get('address')
-                        if address:
-                            addresses.add(address)
-                
-                # Sort addresses
-                sorted_addresses = sorted(list(addresses))
-                
-                def update_ui():
-                    # Clear the model
-                    while self.contacts_model.get_n_items() > 0:
-                        self.contacts_model.remove(0)
-                    
-                    # Add contacts
-                    if sorted_addresses:
-                        for address in sorted_addresses:
-                            self.contacts_model.append(address)
-                    else:
-                        self.contacts_model.append("No contacts found")
-                
-                GLib.idle_add(update_ui)
-        
-        except Exception as e:
-            def update_ui():
-                # Clear the model
-                while self.contacts_model.get_n_items() > 0:
-                    self.contacts_model.remove(0)
-                self.contacts_model.append("Failed to load contacts")
-            GLib.idle_add(update_ui)
+            # Existing items and the selection are left alone
+            self.contacts_model.splice(self.contacts_model.get_n_items(), 0, new_addresses)
+        finally:
+            self._updating_contacts = False
+    
+    def show_contacts(self, sorted_addresses):
+        """Fill the contacts dropdown with the loaded addresses."""
+        self.set_contact_items(sorted_addresses or ["No contacts found"])
+        self._has_contacts = bool(sorted_addresses)
+    
+    def on_contacts_failed(self, error):
+        """Show that the contacts could not be loaded."""
+        self.set_contact_items(["Failed to load contacts"])
+        self._has_contacts = False
+    
+    def set_contact_items(self, items):
+        """Replace the dropdown contents in one splice, keeping the user's pick selected."""
+        self._updating_contacts = True
+        try:
+            self.contacts_model.splice(0, self.contacts_model.get_n_items(), items)
+            if self._picked_contact in items:
+                self.contacts_dropdown.set_selected(items.index(self._picked_contact))
+        finally:
+            self._updating_contacts = False
     
     def create_chat(self, address, message):
         """Create a new chat with the specified address and message."""
-        def run_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.create_chat_async(address, message))
-                loop.close()
-            except Exception as e:
-                error_message = f"Failed to create chat: {str(e)}"
-                def show_error():
-                    self.create_button.set_sensitive(True)
-                    self.create_button.set_label("Create Chat")
-                    self.show_error(error_message)
-                GLib.idle_add(show_error)
-        
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
-    
-    async def create_chat_async(self, address, message):
-        """Create chat asynchronously."""
-        config = self.config_manager.get_server_config()
+        config = self._server_config
         if not config['url'] or not config['password']:
-            def show_error():
-                self.create_button.set_sensitive(True)
-                self.create_button.set_label("Create Chat")
-                self.show_error("No server configuration found")
-            GLib.idle_add(show_error)
+            self.restore_create_button("No server configuration found")
             return
         
-        try:
-            api_method = self.application.config_manager.get_api_method()
-            async with BlueBubblesClient(config['url'], config['password'], api_method) as client:
-                # Create the chat
-                result = await client.create_chat([address], message=message)
-                
-                def on_success():
-                    if hasattr(self.parent_window, 'show_toast'):
-                        self.parent_window.show_toast("Chat created successfully!")
-                    
-                    # Refresh the chat list if the method exists
-                    if hasattr(self.parent_window, 'refresh_chat_list'):
-                        self.parent_window.refresh_chat_list()
-                    
-                    self.close()
-                
-                GLib.idle_add(on_success)
-        
-        except BlueBubblesAPIError as e:
-            error_message = f"Failed to create chat: {str(e)}"
-            def show_error():
-                self.create_button.set_sensitive(True)
-                self.create_button.set_label("Create Chat")
-                self.show_error(error_message)
-            GLib.idle_add(show_error)
-        
-        except Exception as e:
-            error_message = f"Unexpected error: {str(e)}"
-            def show_error():
-                self.create_button.set_sensitive(True)
-                self.create_button.set_label("Create Chat")
-                self.show_error(error_message)
-            GLib.idle_add(show_error)
+        self.parent_window._submit(
+            self.create_chat_async(config['url'], config['password'], self._api_method, address, message),
+            self.on_chat_created,
+            self.on_create_failed
+        )
+    
+    async def create_chat_async(self, server_url: str, password: str, api_method: str, address, message):
+        """Create chat asynchronously."""
+        async with self.chat_service.client(server_url, password, api_method) as client:
+            # Create the chat
+            result = await client.create_chat([address], message=message)
+        
+        # The new participant should show up the next time contacts load
+        _contacts_cache.pop(server_url, None)
+        return result
+    
+    def on_chat_created(self, result):
+        """Report success, refresh the chat list and close the dialog."""
+        if hasattr(self.parent_window, 'show_toast'):
+            self.parent_window.show_toast("Chat created successfully!")
+        
+        # Refresh the chat list if the method exists
+        if hasattr(self.parent_window, 'refresh_chat_list'):
+            self.parent_window.refresh_chat_list()
+        
+        self.close()
+    
+    def on_create_failed(self, error):
+        """Re-enable the create button and report why the chat was not created."""
+        if isinstance(error, BlueBubblesAPIError):
+            self.restore_create_button(f"Failed to create chat: {str(error)}")
+        else:
+            self.restore_create_button(f"Unexpected error: {str(error)}")
+    
+    def restore_create_button(self, error_message):
+        """Make the create button usable again and show the error."""
+        self.create_button.set_sensitive(True)
+        self.create_button.set_label("Create Chat")
+        self.show_error(error_message)
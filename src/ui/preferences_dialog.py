@@ -6,18 +6,45 @@ Handles application preferences and settings
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
+gi.require_version('Pango', '1.0')
 
-from gi.repository import Gtk, Adw, Gio
+from gi.repository import Gtk, Adw, Gio, GLib, Pango
+
+# Private API warning, parsed once at import instead of on every dialog open
+_WARNING_MARKUP = """<b>🚨 DANGER: EXPERIMENTAL FEATURE 🚨</b>
+
+<b>Using Private API may:</b>
+• Cause app crashes and system instability
+• Break compatibility with future macOS updates
+• Potentially violate Apple's terms of service
+• Lead to unexpected behavior or data corruption
+• Require technical knowledge to troubleshoot
+
+<b>This feature is intended for:</b>
+• Advanced users and developers only
+• Testing and experimental purposes
+• Users who understand the risks involved
+
+<b>⚠️ USE AT YOUR OWN RISK ⚠️</b>
+We are not responsible for any damage or issues caused by enabling this feature."""
+_, _WARNING_ATTRS, _WARNING_TEXT, _ = Pango.parse_markup(_WARNING_MARKUP, -1, '\0')
 
 
 class PreferencesDialog(Adw.PreferencesDialog):
     """Preferences dialog for application settings."""
     
+    # Wait for the spin button to settle before saving the text width
+    TEXT_WIDTH_DEBOUNCE_MS = 250
+    
     def __init__(self, application):
         super().__init__()
         self.application = application
         self.config_manager = application.config_manager
         
+        self._pending_text_width = None
+        self._text_width_save_id = 0
+        self.connect("closed", self.on_closed)
+        
         self.set_title("Preferences")
         
         self.setup_ui()
@@ -25,53 +52,58 @@ class PreferencesDialog(Adw.PreferencesDialog):
     
     def setup_ui(self):
         """Set up the preferences dialog UI."""
-        # Create main preferences page
-        main_page = Adw.PreferencesPage()
-        main_page.set_title("General")
-        main_page.set_icon_name("preferences-system-symbolic")
+        # Widgets take their properties at construction so each is created
+        # in a single call instead of one setter call per attribute
+        main_page = Adw.PreferencesPage(
+            title="General",
+            icon_name="preferences-system-symbolic"
+        )
         
         # Appearance Group
-        appearance_group = Adw.PreferencesGroup()
-        appearance_group.set_title("Appearance")
-        appearance_group.set_description("Customize the application appearance")
+        appearance_group = Adw.PreferencesGroup(
+            title="Appearance",
+            description="Customize the application appearance"
+        )
         
         # Dark Mode Toggle
-        self.dark_mode_row = Adw.SwitchRow()
-        self.dark_mode_row.set_title("Dark Mode")
-        self.dark_mode_row.set_subtitle("Use dark theme for the application interface")
+        self.dark_mode_row = Adw.SwitchRow(
+            title="Dark Mode",
+            subtitle="Use dark theme for the application interface"
+        )
         self.dark_mode_row.connect("notify::active", self.on_dark_mode_changed)
         appearance_group.add(self.dark_mode_row)
         
-        # Text Width Setting
-        self.text_width_row = Adw.SpinRow()
-        self.text_width_row.set_title("Text Width")
-        self.text_width_row.set_subtitle("Maximum width for text content (affects message display and readability)")
-        
-        # Set up adjustment for text width (range: 60-150, step: 5, default: 80)
-        adjustment = Gtk.Adjustment()
-        adjustment.set_lower(60)
-        adjustment.set_upper(150)
-        adjustment.set_step_increment(5)
-        adjustment.set_page_increment(10)
-        adjustment.set_value(80)  # Default value
-        
-        self.text_width_row.set_adjustment(adjustment)
+        # Text Width Setting (range: 60-150, step: 5, default: 80)
+        adjustment = Gtk.Adjustment(
+            lower=60,
+            upper=150,
+            step_increment=5,
+            page_increment=10,
+            value=80
+        )
+        self.text_width_row = Adw.SpinRow(
+            title="Text Width",
+            subtitle="Maximum width for text content (affects message display and readability)",
+            adjustment=adjustment
+        )
         self.text_width_row.connect("notify::value", self.on_text_width_changed)
         appearance_group.add(self.text_width_row)
         
         main_page.add(appearance_group)
         
         # Server Group
-        server_group = Adw.PreferencesGroup()
-        server_group.set_title("Server")
-        server_group.set_description("Manage your BlueBubbles server connection")
+        server_group = Adw.PreferencesGroup(
+            title="Server",
+            description="Manage your BlueBubbles server connection"
+        )
         
         # Server Info Row (Read-only display)
         server_config = self.config_manager.get_server_config()
         if server_config['url']:
-            self.server_info_row = Adw.ActionRow()
-            self.server_info_row.set_title("Current Server")
-            self.server_info_row.set_subtitle(server_config['url'])
+            self.server_info_row = Adw.ActionRow(
+                title="Current Server",
+                subtitle=server_config['url']
+            )
             
             # Add an icon to show connection status
             status_icon = Gtk.Image.new_from_icon_name("network-server-symbolic")
@@ -81,14 +113,16 @@ class PreferencesDialog(Adw.PreferencesDialog):
             server_group.add(self.server_info_row)
         
         # Forget Server Button
-        self.forget_server_row = Adw.ActionRow()
-        self.forget_server_row.set_title("Forget Server")
-        self.forget_server_row.set_subtitle("Remove saved server configuration and return to login")
-        
-        forget_button = Gtk.Button()
-        forget_button.set_label("Forget")
-        forget_button.add_css_class("destructive-action")
-        forget_button.set_valign(Gtk.Align.CENTER)
+        self.forget_server_row = Adw.ActionRow(
+            title="Forget Server",
+            subtitle="Remove saved server configuration and return to login"
+        )
+        
+        forget_button = Gtk.Button(
+            label="Forget",
+            css_classes=["destructive-action"],
+            valign=Gtk.Align.CENTER
+        )
         forget_button.connect("clicked", self.on_forget_server_clicked)
         
         self.forget_server_row.add_suffix(forget_button)
@@ -101,80 +135,84 @@ class PreferencesDialog(Adw.PreferencesDialog):
         # Add the main page to the dialog
         self.add(main_page)
         
-        # Advanced page (for future use)
-        advanced_page = Adw.PreferencesPage()
-        advanced_page.set_title("Advanced")
-        advanced_page.set_icon_name("dialog-warning-symbolic")
+        # Advanced page; most opens never visit it, so its contents are
+        # built the first time it is shown
+        self.advanced_page = Adw.PreferencesPage(
+            title="Advanced",
+            icon_name="dialog-warning-symbolic"
+        )
+        self._advanced_page_built = False
+        self.add(self.advanced_page)
+        self.connect("notify::visible-page", self.on_visible_page_changed)
+    
+    def on_visible_page_changed(self, dialog, pspec):
+        """Build the Advanced page the first time the user switches to it."""
+        if not self._advanced_page_built and self.get_visible_page() is self.advanced_page:
+            self.build_advanced_page()
+    
+    def build_advanced_page(self):
+        """Fill in the Advanced page."""
+        self._advanced_page_built = True
         
         # API Method Group
-        api_group = Adw.PreferencesGroup()
-        api_group.set_title("⚠️ Dangerous Zone")
-        api_group.set_description("These settings can break functionality. Only modify if you know what you're doing!")
-        
-        # API Method Selection
-        self.api_method_row = Adw.SwitchRow()
-        self.api_method_row.set_title("🔴 Use Private API")
-        self.api_method_row.set_subtitle("⚠️ EXPERIMENTAL: Switch from AppleScript to Private API\n❌ This may cause instability, crashes, or data loss\n🚫 NOT recommended for general use")
+        api_group = Adw.PreferencesGroup(
+            title="⚠️ Dangerous Zone",
+            description="These settings can break functionality. Only modify if you know what you're doing!"
+        )
+        
+        # API Method Selection (styled to look dangerous)
+        self.api_method_row = Adw.SwitchRow(
+            title="🔴 Use Private API",
+            subtitle="⚠️ EXPERIMENTAL: Switch from AppleScript to Private API\n❌ This may cause instability, crashes, or data loss\n🚫 NOT recommended for general use",
+            css_classes=["error"]
+        )
+        # Load the current preference before connecting so it doesn't prompt
+        api_method = self.config_manager.get_api_method()
+        self.api_method_row.set_active(api_method == 'private')
         self.api_method_row.connect("notify::active", self.on_api_method_changed)
         
-        # Make the toggle look dangerous
-        self.api_method_row.add_css_class("error")
-        
         api_group.add(self.api_method_row)
         
         # Warning expandable row
-        warning_row = Adw.ExpanderRow()
-        warning_row.set_title("⚠️ Read This Before Enabling")
-        warning_row.set_subtitle("Important warnings about Private API usage")
-        warning_row.add_css_class("error")
+        warning_row = Adw.ExpanderRow(
+            title="⚠️ Read This Before Enabling",
+            subtitle="Important warnings about Private API usage",
+            css_classes=["error"]
+        )
         
         # Warning content
-        warning_content = Gtk.Label()
-        warning_content.set_markup("""<b>🚨 DANGER: EXPERIMENTAL FEATURE 🚨</b>
-
-<b>Using Private API may:</b>
-• Cause app crashes and system instability
-• Break compatibility with future macOS updates
-• Potentially violate Apple's terms of service
-• Lead to unexpected behavior or data corruption
-• Require technical knowledge to troubleshoot
-
-<b>This feature is intended for:</b>
-• Advanced users and developers only
-• Testing and experimental purposes
-• Users who understand the risks involved
-
-<b>⚠️ USE AT YOUR OWN RISK ⚠️</b>
-We are not responsible for any damage or issues caused by enabling this feature.""")
-        
-        warning_content.set_wrap(True)
-        warning_content.set_halign(Gtk.Align.START)
-        warning_content.set_margin_top(10)
-        warning_content.set_margin_bottom(10)
-        warning_content.set_margin_start(10)
-        warning_content.set_margin_end(10)
-        warning_content.add_css_class("warning")
+        warning_content = Gtk.Label(
+            wrap=True,
+            halign=Gtk.Align.START,
+            margin_top=10,
+            margin_bottom=10,
+            margin_start=10,
+            margin_end=10,
+            css_classes=["warning"]
+        )
+        warning_content.set_text(_WARNING_TEXT)
+        warning_content.set_attributes(_WARNING_ATTRS)
         
         warning_row.add_row(warning_content)
         api_group.add(warning_row)
         
-        advanced_page.add(api_group)
+        self.advanced_page.add(api_group)
         
         # Other Advanced Settings Group (placeholder for future)
-        other_advanced_group = Adw.PreferencesGroup()
-        other_advanced_group.set_title("Other Advanced Settings")
-        other_advanced_group.set_description("Additional advanced configuration options")
+        other_advanced_group = Adw.PreferencesGroup(
+            title="Other Advanced Settings",
+            description="Additional advanced configuration options"
+        )
         
         # Placeholder row
-        placeholder_row = Adw.ActionRow()
-        placeholder_row.set_title("More settings coming soon")
-        placeholder_row.set_subtitle("Additional preferences will be added in future versions")
-        placeholder_row.set_sensitive(False)
+        placeholder_row = Adw.ActionRow(
+            title="More settings coming soon",
+            subtitle="Additional preferences will be added in future versions",
+            sensitive=False
+        )
         
         other_advanced_group.add(placeholder_row)
-        advanced_page.add(other_advanced_group)
-        
-        self.add(advanced_page)
+        self.advanced_page.add(other_advanced_group)
     
     def load_preferences(self):
         """Load current preferences from config."""
@@ -185,10 +223,6 @@ We are not responsible for any damage or issues caused by enabling this feature.
         # Load text width preference
         text_width = self.config_manager.get('appearance.text_width', 80)
         self.text_width_row.set_value(text_width)
-        
-        # Load API method preference
-        api_method = self.config_manager.get_api_method()
-        self.api_method_row.set_active(api_method == 'private')
     
     def on_dark_mode_changed(self, switch_row, pspec):
         """Handle dark mode toggle change."""
@@ -203,9 +237,27 @@ We are not responsible for any damage or issues caused by enabling this feature.
             style_manager.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
     
     def on_text_width_changed(self, spin_row, pspec):
-        """Handle text width change."""
-        width = int(spin_row.get_value())
-        self.config_manager.set('appearance.text_width', width)
+        """Handle text width change; the config write is debounced."""
+        self._pending_text_width = int(spin_row.get_value())
+        if self._text_width_save_id:
+            GLib.source_remove(self._text_width_save_id)
+        self._text_width_save_id = GLib.timeout_add(
+            self.TEXT_WIDTH_DEBOUNCE_MS, self.save_text_width
+        )
+    
+    def save_text_width(self):
+        """Write the last text width the user picked to the config."""
+        self._text_width_save_id = 0
+        if self._pending_text_width is not None:
+            self.config_manager.set('appearance.text_width', self._pending_text_width)
+            self._pending_text_width = None
+        return False
+    
+    def on_closed(self, dialog):
+        """Save a text width change that is still waiting on the debounce."""
+        if self._text_width_save_id:
+            GLib.source_remove(self._text_width_save_id)
+            self.save_text_width()
     
     def on_api_method_changed(self, switch_row, pspec):
         """Handle API method toggle change."""